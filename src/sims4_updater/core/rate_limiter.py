@@ -24,9 +24,17 @@ class TokenBucketRateLimiter:
     ``acquire(n)`` call consumes *n* tokens and blocks if insufficient
     tokens are available.  Burst capacity is capped at one second of
     tokens to prevent long idle periods from building excessive credit.
+
+    If *cancel_event* is given, a blocked ``acquire`` returns as soon as
+    the event is set instead of finishing its wait.
     """
 
-    def __init__(self, max_bytes_per_sec: int = 0) -> None:
+    def __init__(
+        self,
+        max_bytes_per_sec: int = 0,
+        cancel_event: threading.Event | None = None,
+    ) -> None:
+        self._cancel = cancel_event or threading.Event()
         self._lock = threading.Lock()
         self._max_rate = max(0, max_bytes_per_sec)
         self._tokens = 0.0
@@ -75,4 +83,5 @@ class TokenBucketRateLimiter:
 
                 wait_time = remaining / self._max_rate
 
-            time.sleep(min(wait_time, 1.0))
+            if self._cancel.wait(min(wait_time, 1.0)):
+                return  # cancelled — let the caller's cancel check take over
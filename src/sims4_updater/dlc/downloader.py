@@ -179,9 +179,8 @@ class DLCDownloader:
                             entry.dlc_id,
                             e,
                         )
-                        import time
-
-                        time.sleep(2**attempt)
+                        if self._cancel.wait(2**attempt):
+                            raise
                         continue
                     raise
             else:
@@ -413,7 +412,7 @@ class ParallelDLCDownloader:
         self._proceed = threading.Event()
         self._proceed.set()  # start in running (unpaused) state
         self._max_workers = max(1, min(max_workers, 10))
-        self._rate_limiter = TokenBucketRateLimiter(speed_limit_bytes)
+        self._rate_limiter = TokenBucketRateLimiter(speed_limit_bytes, cancel_event=self._cancel)
         self._register_lock = threading.Lock()
         self._auth = auth
 
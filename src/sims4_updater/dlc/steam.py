@@ -2,17 +2,26 @@
 Steam price service — fetches DLC pricing from the Steam Store API.
 
 Caching: In-memory TTL cache (30 minutes). Prices rarely change mid-session.
+When given a path, the cache also persists the last fetch to disk for about a
+day (with random jitter) so warm starts skip the network entirely.
 Rate limiting: Steam allows ~200 requests per 5 minutes. With ~109 DLCs
-and 8 concurrent workers, a single batch fetch completes in ~3 seconds.
+and 6 concurrent workers, each on its own keep-alive session, a single batch
+fetch completes in a few seconds. Throttled (429) and server-error (5xx)
+responses are retried with exponential backoff.
 """
 
 from __future__ import annotations
 
+import json
 import logging
+import os
+import random
+import threading
 import time
 from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
+from pathlib import Path
 
 import requests
 
@@ -21,8 +30,28 @@ logger = logging.getLogger(__name__)
 STEAM_API_URL = "https://store.steampowered.com/api/appdetails"
 STEAM_STORE_URL = "https://store.steampowered.com/app/{app_id}"
 CACHE_TTL_SECONDS = 1800  # 30 minutes
+DISK_CACHE_TTL_SECONDS = 86400  # 24 hours
+DISK_CACHE_JITTER_SECONDS = 3600  # +/- so entries don't all expire together
 REQUEST_TIMEOUT = 10
-MAX_WORKERS = 8
+MAX_WORKERS = 6
+RETRY_BACKOFF = (1, 2, 4)  # seconds to wait before each retry
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# requests.Session isn't documented as thread-safe (cookies and adapter state
+# change per request), so each worker thread gets its own
+_thread_local = threading.local()
+
+
+def _get_session() -> requests.Session:
+    """Return this thread's Steam Store session, creating it on first use.
+
+    A worker reuses its session for every app ID it fetches, keeping the TLS
+    connection alive instead of paying a fresh handshake per request.
+    """
+    session = getattr(_thread_local, "session", None)
+    if session is None:
+        session = _thread_local.session = requests.Session()
+    return session
 
 
 @dataclass
@@ -48,17 +77,19 @@ class SteamPrice:
 
 
 class SteamPriceCache:
-    """In-memory cache with TTL for Steam price data."""
+    """In-memory cache with TTL for Steam price data, optionally persisted to disk."""
 
-    def __init__(self, ttl: int = CACHE_TTL_SECONDS):
+    def __init__(self, ttl: int = CACHE_TTL_SECONDS, path: Path | None = None):
         self._ttl = ttl
+        self._path = path
         self._data: dict[int, SteamPrice] = {}
-        self._fetched_at: float = 0.0
+        self._expires_at: float = 0.0  # time.monotonic() deadline
+        self._disk_checked = False  # the snapshot is read at most once
         self.is_fetching: bool = False
 
     @property
     def is_valid(self) -> bool:
-        return bool(self._data) and (time.monotonic() - self._fetched_at) < self._ttl
+        return bool(self._data) and time.monotonic() < self._expires_at
 
     def get(self, app_id: int) -> SteamPrice | None:
         if not self.is_valid:
@@ -72,24 +103,83 @@ class SteamPriceCache:
 
     def update(self, prices: dict[int, SteamPrice]):
         self._data.update(prices)
-        self._fetched_at = time.monotonic()
+        self._expires_at = time.monotonic() + self._ttl
 
     def clear(self):
         self._data.clear()
-        self._fetched_at = 0.0
+        self._expires_at = 0.0
+
+    def load(self) -> bool:
+        """Populate the cache from the on-disk snapshot if it hasn't expired.
+
+        Returns True if fresh prices were loaded. The file is only read on the
+        first call: a loaded snapshot's expiry becomes the in-memory deadline,
+        and a missing or expired one won't turn fresh later, so repeat calls
+        return False without touching the disk.
+        """
+        if self._disk_checked or self._path is None:
+            return False
+        self._disk_checked = True
+        if not self._path.is_file():
+            return False
+        try:
+            with open(self._path, encoding="utf-8") as f:
+                data = json.load(f)
+            remaining = float(data["expires_at"]) - time.time()
+            if remaining <= 0:
+                return False
+            prices = {int(k): SteamPrice(**v) for k, v in data["prices"].items()}
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.debug("Ignoring unreadable Steam price cache %s: %s", self._path, e)
+            return False
+        if not prices:
+            return False
+        self._data.update(prices)
+        self._expires_at = time.monotonic() + remaining
+        return True
+
+    def save(self):
+        """Write the cached prices to disk (atomic). No-op without a path."""
+        if self._path is None or not self._data:
+            return
+        ttl = DISK_CACHE_TTL_SECONDS + random.randint(
+            -DISK_CACHE_JITTER_SECONDS, DISK_CACHE_JITTER_SECONDS
+        )
+        data = {
+            "expires_at": time.time() + ttl,
+            "prices": {str(k): asdict(v) for k, v in self._data.items()},
+        }
+        tmp = self._path.with_suffix(".json_tmp")
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp, self._path)
+        except OSError as e:
+            tmp.unlink(missing_ok=True)
+            logger.debug("Could not write Steam price cache: %s", e)
 
 
 def _fetch_single_price(
     app_id: int,
     cc: str = "US",
 ) -> SteamPrice | None:
-    """Fetch price for a single Steam app ID. Returns None on error."""
+    """Fetch price for a single Steam app ID. Returns None on error.
+
+    Retries with exponential backoff when Steam throttles (429) or fails
+    with a server error, which it does when flooded with requests.
+    """
+    params = {"appids": str(app_id), "cc": cc, "filters": "price_overview"}
     try:
-        resp = requests.get(
-            STEAM_API_URL,
-            params={"appids": str(app_id), "cc": cc, "filters": "price_overview"},
-            timeout=REQUEST_TIMEOUT,
-        )
+        session = _get_session()
+        for delay in (*RETRY_BACKOFF, None):
+            resp = session.get(STEAM_API_URL, params=params, timeout=REQUEST_TIMEOUT)
+            if resp.status_code not in _RETRY_STATUSES or delay is None:
+                break
+            logger.debug(
+                "Steam returned %s for %s, retrying in %ss", resp.status_code, app_id, delay
+            )
+            time.sleep(delay)
         resp.raise_for_status()
         data = resp.json()
 
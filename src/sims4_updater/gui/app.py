@@ -19,7 +19,7 @@ from threading import Lock
 
 import customtkinter as ctk
 
-from ..config import Settings
+from ..config import Settings, get_app_dir
 from ..dlc.steam import SteamPriceCache
 from ..updater import Sims4Updater
 from . import theme
@@ -97,7 +97,7 @@ class App(ctk.CTk):
 
         identity.configure(get_machine_id(), self.settings.uid)
 
-        self.price_cache = SteamPriceCache()
+        self.price_cache = SteamPriceCache(path=get_app_dir() / "steam_prices.json")
         self.updater = Sims4Updater(
             ask_question=self._ask_question,
             callback=self._enqueue_callback,
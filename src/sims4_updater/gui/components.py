@@ -13,6 +13,7 @@ Components:
 from __future__ import annotations
 
 import contextlib
+import functools
 import logging
 from typing import TYPE_CHECKING
 
@@ -34,6 +35,12 @@ def get_animator() -> Animator:
     return _animator
 
 
+@functools.cache
+def theme_font(spec: tuple) -> ctk.CTkFont:
+    """Shared CTkFont for a ``theme.FONT_*`` tuple, so every frame reuses one per style."""
+    return ctk.CTkFont(*spec)
+
+
 # ── InfoCard ────────────────────────────────────────────────────
 
 
@@ -77,6 +84,8 @@ class InfoCard(ctk.CTkFrame):
 
 # ── StatusBadge ─────────────────────────────────────────────────
 
+_BADGE_DOT_FONT = (None, 8)  # default family; shared via theme_font like FONT_* specs
+
 _BADGE_STYLES = {
     "success": {
         "bg": theme.COLORS["toast_success"],
@@ -119,7 +128,7 @@ class StatusBadge(ctk.CTkFrame):
         self._dot = ctk.CTkLabel(
             self,
             text="\u25cf",
-            font=ctk.CTkFont(size=8),
+            font=theme_font(_BADGE_DOT_FONT),
             text_color=s["dot"],
             width=12,
         )
@@ -128,15 +137,18 @@ class StatusBadge(ctk.CTkFrame):
         self._label = ctk.CTkLabel(
             self,
             text=text,
-            font=ctk.CTkFont(*theme.FONT_SMALL),
+            font=theme_font(theme.FONT_SMALL),
             text_color=s["text"],
         )
         self._label.pack(side="left", padx=(2, 10), pady=4)
 
         self._style = style
+        self._text = text
 
     def set_status(self, text: str, style: str = ""):
         """Update badge text and optionally change style."""
+        if text == self._text and (not style or style == self._style):
+            return  # nothing to redraw
         if style and style != self._style:
             s = _BADGE_STYLES.get(style, _BADGE_STYLES["muted"])
             self._style = style
@@ -157,7 +169,9 @@ class StatusBadge(ctk.CTkFrame):
             self._dot.configure(text_color=s["dot"])
             self._label.configure(text_color=s["text"])
 
-        self._label.configure(text=text)
+        if text != self._text:
+            self._text = text
+            self._label.configure(text=text)
 
 
 # ── ToastNotification ───────────────────────────────────────────
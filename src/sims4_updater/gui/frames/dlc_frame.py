@@ -6,7 +6,11 @@ pill status badges, GreenLuma readiness indicators, and widget-reuse-based filte
 
 from __future__ import annotations
 
+import functools
+import logging
 import webbrowser
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -17,30 +21,48 @@ from ...dlc.catalog import DLCInfo, DLCStatus
 from ...dlc.steam import SteamPrice, fetch_prices_batch
 from ...patch.manifest import DLCDownloadEntry
 from .. import theme
-from ..components import get_animator
+from ..components import get_animator, theme_font
 
 if TYPE_CHECKING:
     from ..app import App
 
+logger = logging.getLogger(__name__)
+
+
+# Theme colors, resolved once at import instead of per widget
+_ACCENT = theme.COLORS["accent"]
+_ACCENT_HOVER = theme.COLORS["accent_hover"]
+_BG_CARD = theme.COLORS["bg_card"]
+_BG_CARD_ALT = theme.COLORS["bg_card_alt"]
+_BORDER = theme.COLORS["border"]
+_SUCCESS = theme.COLORS["success"]
+_SEPARATOR = theme.COLORS["separator"]
+_TEXT = theme.COLORS["text"]
+_TEXT_MUTED = theme.COLORS["text_muted"]
+_WARNING = theme.COLORS["warning"]
 
 # Status tag colors and background tints
 _STATUS_COLORS = {
-    "Owned": theme.COLORS["success"],
+    "Owned": _SUCCESS,
     "Ready": theme.COLORS["status_ready"],
-    "Disabled": theme.COLORS["text_muted"],
-    "Incomplete Install": theme.COLORS["warning"],
-    "Not Downloaded": theme.COLORS["warning"],
-    "Not Installed": theme.COLORS["text_muted"],
+    "Disabled": _TEXT_MUTED,
+    "Incomplete Install": _WARNING,
+    "Not Downloaded": _WARNING,
+    "Not Installed": _TEXT_MUTED,
 }
 _STATUS_BG = {
     "Owned": theme.COLORS["toast_success"],
     "Ready": theme.COLORS["status_ready_bg"],
-    "Disabled": theme.COLORS["bg_card_alt"],
+    "Disabled": _BG_CARD_ALT,
     "Incomplete Install": theme.COLORS["toast_warning"],
     "Not Downloaded": theme.COLORS["toast_warning"],
-    "Not Installed": theme.COLORS["bg_card_alt"],
+    "Not Installed": _BG_CARD_ALT,
 }
 
+# Alternating row backgrounds
+_BG_EVEN = _BG_CARD
+_BG_ODD = _BG_CARD_ALT
+
 # Filter chip definitions: (key, label)
 _FILTER_DEFS = [
     ("owned", "Owned"),
@@ -51,9 +73,40 @@ _FILTER_DEFS = [
     ("on_sale", "On Sale"),
 ]
 
+# Filter chip bits — each state gets a precomputed mask so chip matching is one AND
+_F_OWNED = 1 << 0
+_F_NOT_OWNED = 1 << 1
+_F_INSTALLED = 1 << 2
+_F_PATCHED = 1 << 3
+_F_DOWNLOADABLE = 1 << 4
+_F_ON_SALE = 1 << 5
+_FILTER_BITS = {
+    "owned": _F_OWNED,
+    "not_owned": _F_NOT_OWNED,
+    "installed": _F_INSTALLED,
+    "patched": _F_PATCHED,
+    "downloadable": _F_DOWNLOADABLE,
+    "on_sale": _F_ON_SALE,
+}
+
 # Statuses eligible for download
 _DOWNLOADABLE_STATUSES = {"Not Installed", "Not Downloaded", "Incomplete Install"}
 
+# Quiet period after the last keystroke before the search filter runs
+_SEARCH_DEBOUNCE_MS = 150
+
+# DLC rows built per idle slice, so a full catalog build never blocks input
+_BUILD_CHUNK_ROWS = 10
+
+# Loads faster than this never flash the loading skeleton
+_SKELETON_DELAY_MS = 150
+
+# Click-driven re-layouts are coalesced to at most one per frame
+_LAYOUT_DELAY_MS = 16
+
+# Bindtag shared by every DLC row widget for the hover border effect
+_ROW_HOVER_TAG = "DLCRowHover"
+
 # Pack type ordering and labels
 _TYPE_ORDER = ["expansion", "game_pack", "stuff_pack", "kit", "free_pack", "other"]
 _TYPE_LABELS = {
@@ -66,29 +119,148 @@ _TYPE_LABELS = {
 }
 
 
+@functools.cache
+def _font(
+    size: int, weight: str = "normal", overstrike: bool = False, underline: bool = False
+) -> ctk.CTkFont:
+    """Shared CTkFont per style — rows reuse these instead of each building their own."""
+    return ctk.CTkFont(size=size, weight=weight, overstrike=overstrike, underline=underline)
+
+
+@dataclass(slots=True)
+class _RowWidgets:
+    """Widget refs for one DLC row."""
+
+    row_frame: ctk.CTkFrame
+    info_btn: ctk.CTkButton | None
+    checkbox: ctk.CTkCheckBox
+    uninstall_btn: ctk.CTkButton | None
+    bg_normal: str
+    desc_frame: ctk.CTkFrame | None = None
+    desc_builder: Callable[[], ctk.CTkFrame] | None = None
+    grid_row: int = 0  # row inside the section's content frame; desc sits at +1
+    signature: tuple = ()  # inputs the row was built from, see _row_signature
+
+
+@dataclass(slots=True)
+class _SectionWidgets:
+    """Widget refs for one pack-type section."""
+
+    separator: ctk.CTkFrame
+    header_frame: ctk.CTkFrame
+    arrow_label: ctk.CTkLabel
+    title_label: ctk.CTkLabel
+    count_label: ctk.CTkLabel
+    content_frame: ctk.CTkFrame
+    count_text: str = ""  # text currently shown on count_label
+    rows_built: bool = False  # every row exists; collapsed sections defer theirs
+
+
+@dataclass(slots=True)
+class _StateIndex:
+    """Lookups derived from one DLC state list, built in a single pass."""
+
+    by_type: dict[str, list[DLCStatus]]
+    with_appid: list[DLCStatus]
+    row_meta: dict[str, tuple[str, str, str]]  # dlc_id -> (label, color, pill_bg)
+    names: dict[str, str]  # dlc_id -> localized display name
+    search_index: list[tuple[str, str, DLCStatus]]  # (name_lower, id_lower, state)
+    installed_by_type: dict[str, int]
+    totals: tuple[int, int, int, int]  # (owned, patched, missing, enabled)
+
+    @classmethod
+    def build(cls, states: list[DLCStatus]) -> _StateIndex:
+        """Pure Python, no Tk — safe to call from the load worker thread."""
+        by_type: dict[str, list[DLCStatus]] = {t: [] for t in _TYPE_ORDER}
+        installed_by_type: dict[str, int] = dict.fromkeys(_TYPE_ORDER, 0)
+        with_appid: list[DLCStatus] = []
+        row_meta: dict[str, tuple[str, str, str]] = {}
+        search_index: list[tuple[str, str, DLCStatus]] = []
+        names: dict[str, str] = {}
+        owned = patched = missing = enabled = 0
+        for s in states:
+            name = names[s.dlc.id] = s.dlc.get_name()
+            search_index.append((name.lower(), s.dlc.id.lower(), s))
+            label = s.status_label
+            row_meta[s.dlc.id] = (
+                label,
+                _STATUS_COLORS.get(label, _TEXT_MUTED),
+                _STATUS_BG.get(label, _BG_ODD),
+            )
+            pack_type = s.dlc.pack_type
+            by_type.setdefault(pack_type, []).append(s)
+            if s.dlc.steam_app_id is not None:
+                with_appid.append(s)
+            if s.installed:
+                installed_by_type[pack_type] = installed_by_type.get(pack_type, 0) + 1
+                if s.registered:
+                    patched += 1
+            else:
+                missing += 1
+            if s.owned:
+                owned += 1
+            if s.enabled is True:
+                enabled += 1
+        return cls(
+            by_type=by_type,
+            with_appid=with_appid,
+            row_meta=row_meta,
+            names=names,
+            search_index=search_index,
+            installed_by_type=installed_by_type,
+            totals=(owned, patched, missing, enabled),
+        )
+
+
 class DLCFrame(ctk.CTkFrame):
     def __init__(self, parent, app: App):
         super().__init__(parent, fg_color="transparent")
         self.app = app
         self._animator = get_animator()
+        # One class binding serves every row, instead of a bind() per widget
+        self.bind_class(_ROW_HOVER_TAG, "<Enter>", self._on_row_enter)
+        self.bind_class(_ROW_HOVER_TAG, "<Leave>", self._on_row_leave)
 
         # Widget-reuse state
         self._built = False
         self._loading = False  # guard against re-entrant _load_dlcs calls
         self._all_states: list[DLCStatus] = []
-        self._row_widgets: dict[str, dict] = {}  # dlc_id -> widget refs
+        self._game_dir: str | None = None  # dir the current states were loaded from
+        self._states_by_type: dict[str, list[DLCStatus]] = {}  # pack_type -> states
+        self._states_with_appid: list[DLCStatus] = []  # states with a Steam app ID
+        self._section_installed_count: dict[str, int] = {}  # pack_type -> installed count
+        self._aggregate_totals: tuple[int, int, int, int] = (0, 0, 0, 0)
+        self._row_meta: dict[str, tuple[str, str, str]] = {}  # dlc_id -> (label, color, pill bg)
+        self._names: dict[str, str] = {}  # dlc_id -> localized display name
+        self._row_widgets: dict[str, _RowWidgets] = {}  # dlc_id -> widget refs
+        self._stale_rows: list[_RowWidgets] = []  # replaced rows, shown until the build lands
         self._checkbox_vars: dict[str, ctk.BooleanVar] = {}
-        self._section_widgets: dict[str, dict] = {}  # pack_type -> widget refs
+        self._section_widgets: dict[str, _SectionWidgets] = {}  # pack_type -> widget refs
         self._section_collapsed: dict[str, bool] = {}
         self._desc_expanded: dict[str, bool] = {}
         self._pending_dlcs = []
         self._pending_widgets: list[ctk.CTkBaseClass] = []
         self._skeleton_widgets: list[ctk.CTkFrame] = []
+        self._skeleton_after_id: str | None = None
+        self._build_iter: Iterator[bool] | None = None  # pending chunked row build
+        self._build_after_id: str | None = None
 
         # Filter state
         self._active_filters: set[str] = set()
         self._filter_buttons: dict[str, ctk.CTkButton] = {}
         self._prices_loaded = False
+        self._price_by_id: dict[str, SteamPrice] = {}  # dlc_id -> price snapshot
+        self._on_sale_ids: frozenset[str] = frozenset()
+        self._state_masks: dict[str, int] = {}  # dlc_id -> _F_* bits
+        self._applied_query = ""  # search text the visible rows currently reflect
+        self._search_after_id: str | None = None  # pending debounced search
+        # (query, active chips) the current layout was built for; None forces a re-layout
+        self._last_filter_key: tuple[str, frozenset[str]] | None = None
+        self._pending_layout_id: str | None = None
+        # (name_lower, id_lower, state) per state, plus the last query's hits so a
+        # query that extends the previous one only rescans those hits
+        self._search_index: list[tuple[str, str, DLCStatus]] = []
+        self._search_hits: tuple[str, list[tuple[str, str, DLCStatus]]] = ("", [])
 
         # DLC download state (used for "Downloadable" filter chip)
         self._dlc_downloads: dict[str, DLCDownloadEntry] = {}
@@ -108,14 +280,14 @@ class DLCFrame(ctk.CTkFrame):
         ctk.CTkLabel(
             header_frame,
             text="DLC Management",
-            font=ctk.CTkFont(*theme.FONT_HEADING),
+            font=theme_font(theme.FONT_HEADING),
         ).grid(row=0, column=0, sticky="w")
 
         self._gl_badge = ctk.CTkLabel(
             header_frame,
             text="\u2714 GreenLuma Installed",
-            font=ctk.CTkFont(size=10, weight="bold"),
-            text_color=theme.COLORS["success"],
+            font=_font(10, "bold"),
+            text_color=_SUCCESS,
         )
         # Hidden by default — shown when GreenLuma is detected
 
@@ -126,10 +298,10 @@ class DLCFrame(ctk.CTkFrame):
         self._go_to_downloader_btn = ctk.CTkButton(
             btn_frame,
             text="Go to Downloader",
-            font=ctk.CTkFont(size=12),
+            font=_font(12),
             height=theme.BUTTON_HEIGHT_SMALL,
             corner_radius=theme.CORNER_RADIUS_SMALL,
-            fg_color=theme.COLORS["success"],
+            fg_color=_SUCCESS,
             hover_color=theme.COLORS["hover_success"],
             text_color=theme.COLORS["bg_dark"],
             command=lambda: self.app._show_frame("downloader"),
@@ -141,11 +313,11 @@ class DLCFrame(ctk.CTkFrame):
         self._auto_btn = ctk.CTkButton(
             btn_frame,
             text="Auto-Toggle",
-            font=ctk.CTkFont(size=12),
+            font=_font(12),
             height=theme.BUTTON_HEIGHT_SMALL,
             corner_radius=theme.CORNER_RADIUS_SMALL,
-            fg_color=theme.COLORS["accent"],
-            hover_color=theme.COLORS["accent_hover"],
+            fg_color=_ACCENT,
+            hover_color=_ACCENT_HOVER,
             command=self._on_auto_toggle,
         )
         self._auto_btn.grid(row=0, column=1, padx=(0, 5), sticky="ew")
@@ -154,16 +326,16 @@ class DLCFrame(ctk.CTkFrame):
         self._apply_btn = ctk.CTkButton(
             btn_frame,
             text="Apply Changes",
-            font=ctk.CTkFont(size=12),
+            font=_font(12),
             height=theme.BUTTON_HEIGHT_SMALL,
             corner_radius=theme.CORNER_RADIUS_SMALL,
-            fg_color=theme.COLORS["bg_card"],
+            fg_color=_BG_CARD,
             command=self._on_apply,
         )
         self._apply_btn.grid(row=0, column=2, sticky="ew")
         CTkToolTip(self._apply_btn, message="Save checkbox changes to crack config")
 
-        # ── Search box (CTkSearchEntry with built-in debounce + clear) ──
+        # ── Search box (CTkSearchEntry with built-in clear; debounced here) ──
         search_frame = ctk.CTkFrame(self, fg_color="transparent")
         search_frame.grid(row=1, column=0, padx=30, pady=(0, 5), sticky="ew")
         search_frame.grid_columnconfigure(0, weight=1)
@@ -171,11 +343,11 @@ class DLCFrame(ctk.CTkFrame):
         self._search_entry = CTkSearchEntry(
             search_frame,
             placeholder_text="Search DLCs...",
-            font=ctk.CTkFont(size=12),
+            font=_font(12),
             height=theme.BUTTON_HEIGHT_SMALL,
             corner_radius=theme.CORNER_RADIUS_SMALL,
-            command=lambda _text: self._apply_filter(),
-            debounce_ms=250,
+            command=self._on_search_changed,
+            debounce_ms=0,  # _on_search_changed debounces so clearing can skip the wait
         )
         self._search_entry.grid(row=0, column=0, sticky="ew")
 
@@ -198,17 +370,17 @@ class DLCFrame(ctk.CTkFrame):
         legend_frame.grid(row=3, column=0, padx=30, pady=(0, 5), sticky="ew")
 
         legend_items = [
-            ("Owned", theme.COLORS["success"], theme.COLORS["toast_success"]),
+            ("Owned", _SUCCESS, theme.COLORS["toast_success"]),
             ("Ready", theme.COLORS["status_ready"], theme.COLORS["status_ready_bg"]),
-            ("Disabled", theme.COLORS["text_muted"], theme.COLORS["bg_card_alt"]),
-            ("Not Installed", theme.COLORS["text_muted"], theme.COLORS["bg_card_alt"]),
+            ("Disabled", _TEXT_MUTED, _BG_CARD_ALT),
+            ("Not Installed", _TEXT_MUTED, _BG_CARD_ALT),
         ]
         col = 0
         for text, text_color, bg_color in legend_items:
             ctk.CTkLabel(
                 legend_frame,
                 text=f"  {text}  ",
-                font=ctk.CTkFont(size=10),
+                font=_font(10),
                 text_color=text_color,
                 fg_color=bg_color,
                 corner_radius=10,
@@ -221,7 +393,7 @@ class DLCFrame(ctk.CTkFrame):
             legend_frame,
             width=1,
             height=18,
-            fg_color=theme.COLORS["border"],
+            fg_color=_BORDER,
         ).grid(row=0, column=col, padx=8)
         col += 1
 
@@ -229,8 +401,8 @@ class DLCFrame(ctk.CTkFrame):
         ctk.CTkLabel(
             legend_frame,
             text="  GL Ready  ",
-            font=ctk.CTkFont(size=10, weight="bold"),
-            text_color=theme.COLORS["success"],
+            font=_font(10, "bold"),
+            text_color=_SUCCESS,
             fg_color=theme.COLORS["toast_success"],
             corner_radius=10,
             height=22,
@@ -241,8 +413,8 @@ class DLCFrame(ctk.CTkFrame):
         ctk.CTkLabel(
             legend_frame,
             text="  GL Incomplete  ",
-            font=ctk.CTkFont(size=10, weight="bold"),
-            text_color=theme.COLORS["warning"],
+            font=_font(10, "bold"),
+            text_color=_WARNING,
             fg_color=theme.COLORS["toast_warning"],
             corner_radius=10,
             height=22,
@@ -252,8 +424,8 @@ class DLCFrame(ctk.CTkFrame):
         self._status_label = ctk.CTkLabel(
             self,
             text="",
-            font=ctk.CTkFont(*theme.FONT_SMALL),
-            text_color=theme.COLORS["text_muted"],
+            font=theme_font(theme.FONT_SMALL),
+            text_color=_TEXT_MUTED,
         )
         self._status_label.grid(row=5, column=0, padx=30, pady=(5, 10), sticky="w")
 
@@ -261,8 +433,8 @@ class DLCFrame(ctk.CTkFrame):
         self._scroll_frame = ctk.CTkScrollableFrame(
             self,
             corner_radius=8,
-            scrollbar_button_color=theme.COLORS["separator"],
-            scrollbar_button_hover_color=theme.COLORS["accent"],
+            scrollbar_button_color=_SEPARATOR,
+            scrollbar_button_hover_color=_ACCENT,
         )
         self._scroll_frame.grid(row=4, column=0, padx=30, pady=0, sticky="nsew")
         self._scroll_frame.grid_columnconfigure(0, weight=1)
@@ -272,13 +444,13 @@ class DLCFrame(ctk.CTkFrame):
         ctk.CTkLabel(
             self._empty_frame,
             text="No DLCs match your filters",
-            font=ctk.CTkFont(size=14),
-            text_color=theme.COLORS["text_muted"],
+            font=_font(14),
+            text_color=_TEXT_MUTED,
         ).pack(pady=(60, 4))
         ctk.CTkLabel(
             self._empty_frame,
             text="Try adjusting your search or filters",
-            font=ctk.CTkFont(*theme.FONT_SMALL),
+            font=theme_font(theme.FONT_SMALL),
             text_color=theme.COLORS["text_dim"],
         ).pack()
 
@@ -286,8 +458,8 @@ class DLCFrame(ctk.CTkFrame):
         self._no_game_label = ctk.CTkLabel(
             self._scroll_frame,
             text="No game directory found. Set it in Settings.",
-            font=ctk.CTkFont(*theme.FONT_BODY),
-            text_color=theme.COLORS["text_muted"],
+            font=theme_font(theme.FONT_BODY),
+            text_color=_TEXT_MUTED,
         )
 
     # ── Filter Chip Logic ──────────────────────────────────────
@@ -300,18 +472,65 @@ class DLCFrame(ctk.CTkFrame):
         else:
             self._active_filters.add(key)
             chip.select()
+        self._schedule_layout()
+
+    def _schedule_layout(self):
+        """Run ``_apply_filter`` once after a burst of clicks settles."""
+        if self._pending_layout_id is not None:
+            self.after_cancel(self._pending_layout_id)
+        self._pending_layout_id = self.after(_LAYOUT_DELAY_MS, self._do_layout)
+
+    def _do_layout(self):
+        self._pending_layout_id = None
         self._apply_filter()
 
     def _is_on_sale(self, dlc: DLCInfo) -> bool:
-        if not dlc.steam_app_id:
-            return False
-        price = self.app.price_cache.get(dlc.steam_app_id)
-        return price is not None and price.on_sale
+        return dlc.id in self._on_sale_ids
 
     def _get_price(self, dlc: DLCInfo) -> SteamPrice | None:
-        if not dlc.steam_app_id:
-            return None
-        return self.app.price_cache.get(dlc.steam_app_id)
+        return self._price_by_id.get(dlc.id)
+
+    def _index_prices(self):
+        """Snapshot the shared price cache into per-DLC lookups.
+
+        Keeps ``price_cache.get`` (TTL check + dict lookup) out of the
+        filter and row-building hot paths.
+        """
+        prices = self.app.price_cache.get_all()
+        by_id = {}
+        for s in self._states_with_appid:
+            price = prices.get(s.dlc.steam_app_id)
+            if price is not None:
+                by_id[s.dlc.id] = price
+        self._price_by_id = by_id
+        self._on_sale_ids = frozenset(did for did, p in by_id.items() if p.on_sale)
+
+    def _index_filter_masks(self):
+        """Precompute each state's filter-chip bitmask.
+
+        Depends on states, prices and manifest downloads, so it is re-run
+        whenever any of those change.
+        """
+        on_sale = self._on_sale_ids
+        downloads = self._dlc_downloads
+        masks = {}
+        for s in self._all_states:
+            m = 0
+            if s.owned:
+                m |= _F_OWNED
+            if s.installed:
+                m |= _F_INSTALLED
+                if s.registered:
+                    m |= _F_PATCHED
+            elif s.dlc.id in downloads:
+                m |= _F_DOWNLOADABLE
+            if not s.owned and not (s.installed and s.registered):
+                m |= _F_NOT_OWNED
+            if s.dlc.id in on_sale:
+                m |= _F_ON_SALE
+            masks[s.dlc.id] = m
+        self._state_masks = masks
+        self._last_filter_key = None
 
     # ── Data Loading ───────────────────────────────────────────
 
@@ -325,7 +544,7 @@ class DLCFrame(ctk.CTkFrame):
         self._loading = True
         self._status_label.configure(text="Loading DLCs...")
         if not self._built:
-            self._show_loading_skeleton()
+            self._schedule_skeleton()
         self.app.run_async(
             self._get_dlc_states,
             on_done=self._on_states_loaded,
@@ -335,8 +554,13 @@ class DLCFrame(ctk.CTkFrame):
     def _get_dlc_states(self):
         game_dir = self.app.updater.find_game_dir()
         if not game_dir:
-            return None, {}, False
+            return None, None, {}, False, None
         states = self.app.updater._dlc_manager.get_dlc_states(game_dir)
+        index = _StateIndex.build(states)
+        # Read the persisted price snapshot here rather than on the Tk thread
+        cache = self.app.price_cache
+        if not cache.is_valid:
+            cache.load()
 
         # GreenLuma readiness (best-effort, don't fail if GL not configured)
         gl_readiness = {}
@@ -358,17 +582,17 @@ class DLCFrame(ctk.CTkFrame):
         except Exception:
             pass
 
-        return states, gl_readiness, gl_installed
+        return states, index, gl_readiness, gl_installed, game_dir
 
     def _on_states_loaded(self, result):
         self._loading = False
-        self._destroy_skeleton()
 
         # Unpack tuple from _get_dlc_states
         if isinstance(result, tuple):
-            states, gl_readiness, gl_installed = result
+            states, index, gl_readiness, gl_installed, game_dir = result
         else:
-            states, gl_readiness, gl_installed = result, {}, False
+            states, index, gl_readiness, gl_installed, game_dir = result, None, {}, False, None
+        self._game_dir = game_dir
 
         self._gl_readiness = gl_readiness
         self._gl_installed = gl_installed
@@ -380,15 +604,27 @@ class DLCFrame(ctk.CTkFrame):
             self._gl_badge.grid_remove()
 
         if states is None:
+            self._cancel_build()
+            self._destroy_stale_rows()
+            self._destroy_skeleton()
             self._all_states = []
+            self._index_states()
             self._show_no_game()
             self.app.update_nav_badge("dlc")
             return
         self._all_states = states
+        self._index_states(index)
+        cache = self.app.price_cache
+        if not self._prices_loaded and cache.is_valid:
+            # Prices from earlier this session, or persisted by a previous one
+            self._prices_loaded = True
+            self._update_sale_chip(cache.get_all())
+        self._index_prices()
+        self._index_filter_masks()
         self._hide_no_game()
 
         # Update sidebar badge with missing/incomplete count
-        not_owned = sum(1 for s in states if not s.installed)
+        not_owned = self._aggregate_totals[2]
         if not_owned > 0:
             self.app.update_nav_badge("dlc", f"({not_owned} missing)")
         else:
@@ -403,13 +639,37 @@ class DLCFrame(ctk.CTkFrame):
             self._load_dlc_downloads()
 
         # Fetch Steam prices if cache is stale
-        cache = self.app.price_cache
         if not cache.is_valid and not cache.is_fetching:
             self._fetch_steam_prices()
 
+    def _index_states(self, index: _StateIndex | None = None):
+        """Install the lookups derived from ``_all_states``.
+
+        Called whenever ``_all_states`` is reassigned so ``_apply_filter`` never
+        has to rescan the full list per keystroke. The load worker passes an
+        index it already built off the UI thread.
+        """
+        if index is None:
+            index = _StateIndex.build(self._all_states)
+        self._states_by_type = index.by_type
+        self._states_with_appid = index.with_appid
+        self._row_meta = index.row_meta
+        self._names = index.names
+        self._search_index = index.search_index
+        self._search_hits = ("", index.search_index)
+        self._section_installed_count = index.installed_by_type
+        self._aggregate_totals = index.totals
+
     # ── Loading Skeleton ──────────────────────────────────────
 
+    def _schedule_skeleton(self):
+        """Show the loading skeleton only if the wait outlasts _SKELETON_DELAY_MS."""
+        if self._skeleton_widgets or self._skeleton_after_id is not None:
+            return
+        self._skeleton_after_id = self.after(_SKELETON_DELAY_MS, self._show_loading_skeleton)
+
     def _show_loading_skeleton(self):
+        self._skeleton_after_id = None
         for i in range(6):
             skel = CTkSkeleton(
                 self._scroll_frame,
@@ -423,6 +683,9 @@ class DLCFrame(ctk.CTkFrame):
             self._skeleton_widgets.append(skel)
 
     def _destroy_skeleton(self):
+        if self._skeleton_after_id is not None:
+            self.after_cancel(self._skeleton_after_id)
+            self._skeleton_after_id = None
         for skel in self._skeleton_widgets:
             skel.destroy()
         self._skeleton_widgets.clear()
@@ -446,14 +709,14 @@ class DLCFrame(ctk.CTkFrame):
 
     def _hide_all_sections(self):
         for sw in self._section_widgets.values():
-            sw["separator"].grid_remove()
-            sw["header_frame"].grid_remove()
-            sw["content_frame"].grid_remove()
+            sw.separator.grid_remove()
+            sw.header_frame.grid_remove()
+            sw.content_frame.grid_remove()
 
     # ── Steam Price Fetching ───────────────────────────────────
 
     def _fetch_steam_prices(self):
-        app_ids = [s.dlc.steam_app_id for s in self._all_states if s.dlc.steam_app_id is not None]
+        app_ids = [s.dlc.steam_app_id for s in self._states_with_appid]
         if not app_ids:
             return
 
@@ -469,18 +732,19 @@ class DLCFrame(ctk.CTkFrame):
         )
 
     def _fetch_prices_bg(self, app_ids):
-        return fetch_prices_batch(app_ids, cc="US")
+        prices = fetch_prices_batch(app_ids, cc="US")
+        # Persist off the Tk thread; the GUI only reads the cache afterwards
+        cache = self.app.price_cache
+        cache.update(prices)
+        cache.save()
+        return prices
 
     def _on_prices_fetched(self, prices):
         self.app.price_cache.is_fetching = False
-        self.app.price_cache.update(prices)
         self._prices_loaded = True
-
-        # Update "On Sale" chip label with count
-        sale_count = sum(1 for p in prices.values() if p.on_sale)
-        btn = self._filter_buttons.get("on_sale")
-        if btn:
-            btn.configure(text=f"On Sale ({sale_count})" if sale_count > 0 else "On Sale")
+        self._index_prices()
+        self._index_filter_masks()
+        self._update_sale_chip(prices)
 
         # Rebuild rows to include price data, then re-filter
         self._rebuild_rows()
@@ -491,61 +755,68 @@ class DLCFrame(ctk.CTkFrame):
         if home and hasattr(home, "update_pricing_card"):
             home.update_pricing_card()
 
+    def _update_sale_chip(self, prices):
+        """Update "On Sale" chip label with count."""
+        sale_count = sum(1 for p in prices.values() if p.on_sale)
+        btn = self._filter_buttons.get("on_sale")
+        if btn:
+            btn.configure(text=f"On Sale ({sale_count})" if sale_count > 0 else "On Sale")
+
     def _on_prices_error(self, error):
         self.app.price_cache.is_fetching = False
-        import logging
-
-        logging.warning("Steam price fetch failed: %s", error)
+        logger.warning("Steam price fetch failed: %s", error)
 
     # ── Search & Filter ────────────────────────────────────────
 
-    def _clear_search(self):
-        self._search_entry.clear()
+    def _on_search_changed(self, text: str):
+        """Debounce search edits; clearing the box applies immediately.
+
+        Bursts of keystrokes that end on the already-applied query do no work.
+        """
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+            self._search_after_id = None
+        query = text.strip().lower()
+        if query == self._applied_query:
+            return
+        if not query:
+            self._apply_filter()
+            return
+        self._search_after_id = self.after(_SEARCH_DEBOUNCE_MS, self._do_search)
+
+    def _do_search(self):
+        self._search_after_id = None
+        self._apply_filter()
 
     def _apply_filter(self):
         """Show/hide pre-built rows based on current filters."""
         if not self._built:
             return
 
-        filtered = list(self._all_states)
-
-        # Text search
         query = self._search_entry.get().strip().lower()
+        key = (query, frozenset(self._active_filters))
+        if key == self._last_filter_key:
+            return
+        self._last_filter_key = key
+
+        # Text search — narrowing the previous hits when the query only grew
+        self._applied_query = query
         if query:
-            filtered = [
-                s
-                for s in filtered
-                if query in s.dlc.get_name().lower() or query in s.dlc.id.lower()
-            ]
+            prev_query, prev_hits = self._search_hits
+            pool = prev_hits if query.startswith(prev_query) else self._search_index
+            hits = [e for e in pool if query in e[0] or query in e[1]]
+            self._search_hits = (query, hits)
+            filtered = [e[2] for e in hits]
+        else:
+            filtered = list(self._all_states)
 
         # Chip filters (OR logic)
         if self._active_filters:
-
-            def matches(state: DLCStatus) -> bool:
-                for f in self._active_filters:
-                    if f == "owned" and state.owned:
-                        return True
-                    if (
-                        f == "not_owned"
-                        and not state.owned
-                        and not (state.installed and state.registered)
-                    ):
-                        return True
-                    if f == "installed" and state.installed:
-                        return True
-                    if f == "patched" and state.registered and state.installed:
-                        return True
-                    if (
-                        f == "downloadable"
-                        and state.dlc.id in self._dlc_downloads
-                        and not state.installed
-                    ):
-                        return True
-                    if f == "on_sale" and self._is_on_sale(state.dlc):
-                        return True
-                return False
-
-            filtered = [s for s in filtered if matches(s)]
+            active_mask = 0
+            for f in self._active_filters:
+                active_mask |= _FILTER_BITS[f]
+            masks = self._state_masks
+            filtered = [s for s in filtered if masks.get(s.dlc.id, 0) & active_mask]
 
         filtered_ids = {s.dlc.id for s in filtered}
 
@@ -558,42 +829,56 @@ class DLCFrame(ctk.CTkFrame):
             if sw is None:
                 continue
 
-            type_states = [s for s in filtered if s.dlc.pack_type == pack_type]
+            section_states = self._states_by_type.get(pack_type, [])
+            type_states = [s for s in section_states if s.dlc.id in filtered_ids]
 
             if not type_states:
-                sw["separator"].grid_remove()
-                sw["header_frame"].grid_remove()
-                sw["content_frame"].grid_remove()
+                sw.separator.grid_remove()
+                sw.header_frame.grid_remove()
+                sw.content_frame.grid_remove()
                 continue
 
             any_visible = True
 
             # Show separator (skip for first visible section)
             if scroll_row > 0:
-                sw["separator"].grid(row=scroll_row, column=0, padx=5, pady=(8, 0), sticky="ew")
+                sw.separator.grid(row=scroll_row, column=0, padx=5, pady=(8, 0), sticky="ew")
                 scroll_row += 1
             else:
-                sw["separator"].grid_remove()
+                sw.separator.grid_remove()
 
             # Update header counts and show
-            sec_installed = sum(1 for s in type_states if s.installed)
             sec_total = len(type_states)
-            is_collapsed = self._section_collapsed.get(pack_type, False)
-            arrow = "\u25b6" if is_collapsed else "\u25bc"
-            sw["arrow_label"].configure(text=arrow)
-            sw["count_label"].configure(text=f"{sec_installed}/{sec_total}")
-            sw["header_frame"].grid(row=scroll_row, column=0, padx=2, pady=(10, 2), sticky="ew")
+            if sec_total == len(section_states):
+                sec_installed = self._section_installed_count.get(pack_type, 0)
+            else:
+                sec_installed = sum(1 for s in type_states if s.installed)
+            count_text = f"{sec_installed}/{sec_total}"
+            if sw.count_text != count_text:
+                sw.count_label.configure(text=count_text)
+                sw.count_text = count_text
+            sw.header_frame.grid(row=scroll_row, column=0, padx=2, pady=(10, 2), sticky="ew")
             scroll_row += 1
 
             # Content frame
-            sw["content_frame"].grid(row=scroll_row, column=0, sticky="ew")
+            sw.content_frame.grid(row=scroll_row, column=0, sticky="ew")
             scroll_row += 1
 
-            if is_collapsed:
-                sw["content_frame"].grid_remove()
+            if self._section_collapsed.get(pack_type, False):
+                sw.content_frame.grid_remove()
                 continue
 
-            # Show/hide individual rows within this section
+            # Hide rows NOT in filtered set first, then grid the visible ones,
+            # so Tk sees one batch of removals followed by one batch of placements
+            for state in section_states:
+                if state.dlc.id not in filtered_ids:
+                    rw = self._row_widgets.get(state.dlc.id)
+                    if rw:
+                        rw.row_frame.grid_remove()
+                        if rw.desc_frame:
+                            rw.desc_frame.grid_remove()
+
+            # Show individual rows within this section
             cb_row = 0
             for state in type_states:
                 dlc_id = state.dlc.id
@@ -602,36 +887,25 @@ class DLCFrame(ctk.CTkFrame):
                     continue
 
                 # Update alternating background
-                bg = theme.COLORS["bg_card"] if cb_row % 2 == 0 else theme.COLORS["bg_card_alt"]
-                rw["row_frame"].configure(fg_color=bg)
-                rw["_bg_normal"] = bg
+                bg = _BG_EVEN if cb_row % 2 == 0 else _BG_ODD
+                if rw.bg_normal != bg:
+                    rw.row_frame.configure(fg_color=bg)
+                    rw.bg_normal = bg
 
-                rw["row_frame"].grid(row=cb_row, column=0, padx=5, pady=3, sticky="ew")
+                rw.row_frame.grid(row=cb_row, column=0, padx=5, pady=3, sticky="ew")
+                rw.grid_row = cb_row
                 cb_row += 1
 
-                # Show/hide description
-                if rw.get("desc_frame"):
-                    if self._desc_expanded.get(dlc_id, False):
-                        rw["desc_frame"].grid(
-                            row=cb_row,
-                            column=0,
-                            padx=(35, 10),
-                            pady=(0, 2),
-                            sticky="ew",
-                        )
-                    else:
-                        rw["desc_frame"].grid_remove()
+                # Show/hide description. The frame only exists once expanded, but
+                # its grid row is always reserved so row backgrounds don't shift.
+                if rw.desc_builder is not None:
+                    if rw.desc_frame is not None:
+                        if self._desc_expanded.get(dlc_id, False):
+                            self._grid_desc(rw)
+                        else:
+                            rw.desc_frame.grid_remove()
                     cb_row += 1
 
-            # Hide rows NOT in filtered set for this section
-            for state in self._all_states:
-                if state.dlc.pack_type == pack_type and state.dlc.id not in filtered_ids:
-                    rw = self._row_widgets.get(state.dlc.id)
-                    if rw:
-                        rw["row_frame"].grid_remove()
-                        if rw.get("desc_frame"):
-                            rw["desc_frame"].grid_remove()
-
         # Pending DLCs
         if self._pending_dlcs and any_visible:
             self._show_pending_section(scroll_row)
@@ -649,66 +923,168 @@ class DLCFrame(ctk.CTkFrame):
             self._search_entry.set_result_count(None)
 
         # Status label
-        total_owned = sum(1 for s in self._all_states if s.owned)
-        total_patched = sum(1 for s in self._all_states if s.registered and s.installed)
-        total_missing = sum(1 for s in self._all_states if not s.installed)
-        total_enabled = sum(1 for s in self._all_states if s.enabled is True)
+        total_owned, total_patched, total_missing, total_enabled = self._aggregate_totals
         self._status_label.configure(
             text=f"{total_owned} owned, {total_patched} patched, "
             f"{total_missing} missing  |  {total_enabled} enabled",
-            text_color=theme.COLORS["text_muted"],
+            text_color=_TEXT_MUTED,
         )
 
     # ── Row Building ───────────────────────────────────────────
 
+    def _row_signature(self, state: DLCStatus) -> tuple:
+        """Everything a row's widgets are built from — equal signatures mean reuse."""
+        dlc_id = state.dlc.id
+        dl_entry = self._dlc_downloads.get(dlc_id)
+        return (
+            state,
+            self._names[dlc_id],
+            self._price_by_id.get(dlc_id),
+            dl_entry.min_version if dl_entry else None,
+            self.app.updater.settings.last_known_version,
+            self._gl_readiness.get(dlc_id),
+        )
+
+    @staticmethod
+    def _initially_checked(state: DLCStatus) -> bool:
+        """Checkbox value a freshly built row starts with."""
+        return state.owned or (state.installed and state.registered and state.enabled is True)
+
+    def _checkbox_var(self, dlc_id: str, value: bool) -> ctk.BooleanVar:
+        """Return the pooled checkbox var for a DLC, set to ``value``.
+
+        Vars outlive row rebuilds so reloads don't allocate a new Tcl variable
+        per DLC.
+        """
+        var = self._checkbox_vars.get(dlc_id)
+        if var is None:
+            var = self._checkbox_vars[dlc_id] = ctk.BooleanVar(value=value)
+        elif var.get() != value:
+            var.set(value)
+        return var
+
     def _rebuild_rows(self):
-        """Destroy old widgets and build all rows fresh from current states."""
-        # Clear existing
-        for rw in self._row_widgets.values():
-            rw["row_frame"].destroy()
-            if rw.get("desc_frame"):
-                rw["desc_frame"].destroy()
-        self._row_widgets.clear()
-        self._checkbox_vars.clear()
+        """Sync row widgets with current states, rebuilding only rows that changed.
+
+        Rows whose inputs are unchanged (same ``_row_signature``) keep their
+        widgets and only have their checkbox reset. Stale rows stay on screen
+        until the chunked build finishes so the list never shows gaps; sections
+        for pack types that disappeared are destroyed.
+        """
+        current = {s.dlc.id: s for s in self._all_states}
+        for dlc_id, rw in list(self._row_widgets.items()):
+            state = current.get(dlc_id)
+            if state is not None and rw.signature == self._row_signature(state):
+                self._checkbox_var(dlc_id, self._initially_checked(state))
+                continue
+            self._stale_rows.append(rw)
+            del self._row_widgets[dlc_id]
+            if state is None:
+                self._checkbox_vars.pop(dlc_id, None)
+            else:
+                # Keep the var for the rebuilt row; until then it stands for the row
+                self._checkbox_var(dlc_id, self._initially_checked(state))
 
-        for sw in self._section_widgets.values():
-            sw["separator"].destroy()
-            sw["header_frame"].destroy()
-            sw["content_frame"].destroy()
-        self._section_widgets.clear()
+        for pack_type, sw in list(self._section_widgets.items()):
+            if self._states_by_type.get(pack_type):
+                continue
+            sw.separator.destroy()
+            sw.header_frame.destroy()
+            sw.content_frame.destroy()
+            del self._section_widgets[pack_type]
 
         # Destroy pending section if any
+        keep = {self._empty_frame, self._no_game_label, *self._skeleton_widgets}
+        for sw in self._section_widgets.values():
+            keep.update((sw.separator, sw.header_frame, sw.content_frame))
         for w in self._scroll_frame.winfo_children():
-            if w not in (self._empty_frame, self._no_game_label):
+            if w not in keep:
                 w.destroy()
 
         self._built = False
+        self._last_filter_key = None
         self._build_all_rows()
 
     def _build_all_rows(self):
-        """Build all section headers and DLC rows once."""
+        """Build all section headers and DLC rows in idle-time chunks.
+
+        The first chunk is built immediately; the rest is scheduled with
+        ``after_idle`` so input and scrolling stay responsive. On a first
+        build the loading skeleton stays up until the last chunk lands and
+        the filter lays the rows out; rebuilds keep the previous rows up
+        instead.
+        """
+        self._cancel_build()
         if not self._all_states:
+            self._destroy_stale_rows()
+            self._destroy_skeleton()
             self._built = True
             return
 
+        if not self._section_widgets:
+            # Rebuilds keep the previous rows up, so only a first build needs it
+            self._schedule_skeleton()
         wrap = max(300, self._scroll_frame.winfo_width() - 80)
-
+        self._build_iter = self._build_all_rows_iter(wrap)
+        self._build_tick()
+
+    def _build_tick(self):
+        """Build the next chunk of rows, then reschedule or finish."""
+        self._build_after_id = None
+        it = self._build_iter
+        if it is None:
+            return
+        for _ in range(_BUILD_CHUNK_ROWS):
+            if next(it, False) is False:
+                self._build_iter = None
+                self._built = True
+                self._destroy_skeleton()
+                # Swap in the new rows in the same tick the old ones go away
+                self._destroy_stale_rows()
+                self._last_filter_key = None
+                self._apply_filter()
+                return
+        self._build_after_id = self.after_idle(self._build_tick)
+
+    def _cancel_build(self):
+        if self._build_after_id is not None:
+            self.after_cancel(self._build_after_id)
+            self._build_after_id = None
+        self._build_iter = None
+
+    def _destroy_stale_rows(self):
+        for rw in self._stale_rows:
+            # Rows of a removed section went down with its content frame
+            if rw.row_frame.winfo_exists():
+                rw.row_frame.destroy()
+            if rw.desc_frame and rw.desc_frame.winfo_exists():
+                rw.desc_frame.destroy()
+        self._stale_rows.clear()
+
+    def _build_all_rows_iter(self, wrap: int) -> Iterator[bool]:
+        """Build sections and rows, yielding after each DLC row."""
         for pack_type in _TYPE_ORDER:
-            type_states = [s for s in self._all_states if s.dlc.pack_type == pack_type]
+            type_states = self._states_by_type.get(pack_type, [])
             if not type_states:
                 continue
 
+            sw = self._section_widgets.get(pack_type)
+            if sw is not None:
+                # Section kept from a previous build — only add missing rows
+                yield from self._build_section_rows(pack_type, sw, wrap)
+                continue
+
             # Section separator
             sep = ctk.CTkFrame(
                 self._scroll_frame,
                 height=1,
-                fg_color=theme.COLORS["separator"],
+                fg_color=_SEPARATOR,
             )
 
             # Section header frame
             header_frame = ctk.CTkFrame(
                 self._scroll_frame,
-                fg_color=theme.COLORS["separator"],
+                fg_color=_SEPARATOR,
                 corner_radius=6,
                 height=38,
             )
@@ -717,9 +1093,9 @@ class DLCFrame(ctk.CTkFrame):
 
             arrow_label = ctk.CTkLabel(
                 header_frame,
-                text="\u25bc",
-                font=ctk.CTkFont(size=14),
-                text_color=theme.COLORS["accent"],
+                text="\u25b6" if self._section_collapsed.get(pack_type, False) else "\u25bc",
+                font=_font(14),
+                text_color=_ACCENT,
                 width=20,
             )
             arrow_label.grid(row=0, column=0, padx=(12, 4), pady=8)
@@ -728,18 +1104,18 @@ class DLCFrame(ctk.CTkFrame):
             title_label = ctk.CTkLabel(
                 header_frame,
                 text=label_text,
-                font=ctk.CTkFont(size=13, weight="bold"),
-                text_color=theme.COLORS["text"],
+                font=_font(13, "bold"),
+                text_color=_TEXT,
                 anchor="w",
             )
             title_label.grid(row=0, column=1, sticky="w", pady=8)
 
-            sec_installed = sum(1 for s in type_states if s.installed)
+            count_text = f"{self._section_installed_count.get(pack_type, 0)}/{len(type_states)}"
             count_label = ctk.CTkLabel(
                 header_frame,
-                text=f"{sec_installed}/{len(type_states)}",
-                font=ctk.CTkFont(size=11),
-                text_color=theme.COLORS["text_muted"],
+                text=count_text,
+                font=_font(11),
+                text_color=_TEXT_MUTED,
                 fg_color=theme.COLORS["bg_dark"],
                 corner_radius=10,
                 width=50,
@@ -756,49 +1132,55 @@ class DLCFrame(ctk.CTkFrame):
                 )
                 widget.bind(
                     "<Leave>",
-                    lambda e, hf=header_frame: hf.configure(fg_color=theme.COLORS["separator"]),
+                    lambda e, hf=header_frame: hf.configure(fg_color=_SEPARATOR),
                 )
 
             # Content frame
             content_frame = ctk.CTkFrame(self._scroll_frame, fg_color="transparent")
             content_frame.grid_columnconfigure(0, weight=1)
 
-            self._section_widgets[pack_type] = {
-                "separator": sep,
-                "header_frame": header_frame,
-                "arrow_label": arrow_label,
-                "title_label": title_label,
-                "count_label": count_label,
-                "content_frame": content_frame,
-            }
+            self._section_widgets[pack_type] = _SectionWidgets(
+                separator=sep,
+                header_frame=header_frame,
+                arrow_label=arrow_label,
+                title_label=title_label,
+                count_label=count_label,
+                content_frame=content_frame,
+                count_text=count_text,
+            )
 
-            # Build DLC rows inside content_frame
-            cb_row = 0
-            for idx, state in enumerate(type_states):
-                self._build_dlc_row(content_frame, state, cb_row, idx, wrap)
-                cb_row += 1
-                if state.dlc.description:
-                    cb_row += 1  # reserve row for desc_frame
+            yield from self._build_section_rows(pack_type, self._section_widgets[pack_type], wrap)
 
-        self._built = True
+    def _build_section_rows(self, pack_type: str, sw: _SectionWidgets, wrap: int) -> Iterator[bool]:
+        """Build a section's missing rows, yielding after each.
+
+        Collapsed sections are skipped; their rows are built on first expand.
+        """
+        if self._section_collapsed.get(pack_type, False):
+            sw.rows_built = False
+            return
+        for idx, state in enumerate(self._states_by_type.get(pack_type, [])):
+            if state.dlc.id not in self._row_widgets:
+                self._build_dlc_row(sw.content_frame, state, 0, idx, wrap)
+                yield True
+        sw.rows_built = True
 
     def _build_dlc_row(self, parent, state: DLCStatus, grid_row: int, idx: int, wrap: int):
         """Build a single DLC row card."""
         dlc = state.dlc
-        name = dlc.get_name()
-        label = state.status_label
-        color = _STATUS_COLORS.get(label, theme.COLORS["text_muted"])
+        name = self._names[dlc.id]
+        label, color, pill_bg = self._row_meta[dlc.id]
         has_desc = bool(dlc.description)
         price = self._get_price(dlc)
 
         # Card-style row frame with alternating bg
-        bg = theme.COLORS["bg_card"] if idx % 2 == 0 else theme.COLORS["bg_card_alt"]
+        bg = _BG_EVEN if idx % 2 == 0 else _BG_ODD
         row_frame = ctk.CTkFrame(
             parent,
             fg_color=bg,
             corner_radius=6,
             border_width=1,
-            border_color=theme.COLORS["border"],
+            border_color=_BORDER,
         )
         row_frame.grid_columnconfigure(1, weight=1)
 
@@ -814,10 +1196,10 @@ class DLCFrame(ctk.CTkFrame):
                 text=arr,
                 width=24,
                 height=24,
-                font=ctk.CTkFont(size=11),
+                font=_font(11),
                 fg_color="transparent",
-                hover_color=theme.COLORS["separator"],
-                text_color=theme.COLORS["text_muted"],
+                hover_color=_SEPARATOR,
+                text_color=_TEXT_MUTED,
                 corner_radius=4,
                 command=lambda did=dlc.id: self._toggle_desc(did),
             )
@@ -825,42 +1207,39 @@ class DLCFrame(ctk.CTkFrame):
             col += 1
 
         # Checkbox
+        var = self._checkbox_var(dlc.id, self._initially_checked(state))
         if state.owned:
-            var = ctk.BooleanVar(value=True)
             cb = ctk.CTkCheckBox(
                 row_frame,
                 text=name,
                 variable=var,
-                font=ctk.CTkFont(size=12),
+                font=_font(12),
                 height=theme.BUTTON_HEIGHT_SMALL,
                 corner_radius=4,
                 state="disabled",
             )
         elif state.installed and state.registered:
-            var = ctk.BooleanVar(value=state.enabled is True)
             cb = ctk.CTkCheckBox(
                 row_frame,
                 text=name,
                 variable=var,
-                font=ctk.CTkFont(size=12),
+                font=_font(12),
                 height=theme.BUTTON_HEIGHT_SMALL,
                 corner_radius=4,
             )
         else:
-            var = ctk.BooleanVar(value=False)
             cb = ctk.CTkCheckBox(
                 row_frame,
                 text=name,
                 variable=var,
-                font=ctk.CTkFont(size=12),
+                font=_font(12),
                 height=theme.BUTTON_HEIGHT_SMALL,
                 corner_radius=4,
-                text_color=theme.COLORS["text_muted"],
+                text_color=_TEXT_MUTED,
                 state="disabled",
             )
         pad_left = 10 if not has_desc else 0
         cb.grid(row=0, column=col, padx=(pad_left, 0), pady=6, sticky="w")
-        self._checkbox_vars[dlc.id] = var
         next_col = col + 1
 
         # Price display
@@ -872,9 +1251,9 @@ class DLCFrame(ctk.CTkFrame):
                 ctk.CTkLabel(
                     price_frame,
                     text=f"-{price.discount_percent}%",
-                    font=ctk.CTkFont(size=10, weight="bold"),
+                    font=_font(10, "bold"),
                     text_color=theme.COLORS["bg_dark"],
-                    fg_color=theme.COLORS["success"],
+                    fg_color=_SUCCESS,
                     corner_radius=4,
                     width=42,
                     height=22,
@@ -883,22 +1262,22 @@ class DLCFrame(ctk.CTkFrame):
                 ctk.CTkLabel(
                     price_frame,
                     text=price.initial_formatted or f"${price.initial_cents / 100:.2f}",
-                    font=ctk.CTkFont(size=10, overstrike=True),
-                    text_color=theme.COLORS["text_muted"],
+                    font=_font(10, overstrike=True),
+                    text_color=_TEXT_MUTED,
                 ).pack(side="left", padx=(0, 6))
 
                 ctk.CTkLabel(
                     price_frame,
                     text=price.final_formatted or f"${price.final_cents / 100:.2f}",
-                    font=ctk.CTkFont(size=12, weight="bold"),
-                    text_color=theme.COLORS["success"],
+                    font=_font(12, "bold"),
+                    text_color=_SUCCESS,
                 ).pack(side="left")
             else:
                 ctk.CTkLabel(
                     price_frame,
                     text=price.final_formatted or f"${price.final_cents / 100:.2f}",
-                    font=ctk.CTkFont(size=11),
-                    text_color=theme.COLORS["text_muted"],
+                    font=_font(11),
+                    text_color=_TEXT_MUTED,
                 ).pack(side="left")
             next_col += 1
 
@@ -909,10 +1288,10 @@ class DLCFrame(ctk.CTkFrame):
                 text="Steam \u2197",
                 width=56,
                 height=24,
-                font=ctk.CTkFont(size=10),
+                font=_font(10),
                 fg_color="transparent",
-                hover_color=theme.COLORS["separator"],
-                text_color=theme.COLORS["accent"],
+                hover_color=_SEPARATOR,
+                text_color=_ACCENT,
                 corner_radius=4,
                 command=lambda aid=dlc.steam_app_id: self._open_steam_page(aid),
             )
@@ -920,11 +1299,10 @@ class DLCFrame(ctk.CTkFrame):
             next_col += 1
 
         # Status pill badge
-        pill_bg = _STATUS_BG.get(label, theme.COLORS["bg_card_alt"])
         pill = ctk.CTkLabel(
             row_frame,
             text=f"  {label}  ",
-            font=ctk.CTkFont(size=10),
+            font=_font(10),
             text_color=color,
             fg_color=pill_bg,
             corner_radius=10,
@@ -943,8 +1321,8 @@ class DLCFrame(ctk.CTkFrame):
                 ver_pill = ctk.CTkLabel(
                     row_frame,
                     text=f"  v{dl_entry.min_version}+  ",
-                    font=ctk.CTkFont(size=10),
-                    text_color=theme.COLORS["warning"],
+                    font=_font(10),
+                    text_color=_WARNING,
                     fg_color=theme.COLORS["toast_warning"],
                     corner_radius=10,
                     height=22,
@@ -955,16 +1333,17 @@ class DLCFrame(ctk.CTkFrame):
         # GreenLuma readiness indicator
         gl_r = self._gl_readiness.get(dlc.id)
         if gl_r is not None:
-            gl_color = theme.COLORS["success"] if gl_r.ready else theme.COLORS["warning"]
+            gl_color = _SUCCESS if gl_r.ready else _WARNING
             gl_bg = theme.COLORS["toast_success"] if gl_r.ready else theme.COLORS["toast_warning"]
             gl_pill = ctk.CTkLabel(
                 row_frame,
                 text="  GL  ",
-                font=ctk.CTkFont(size=10, weight="bold"),
+                font=_font(10, "bold"),
                 text_color=gl_color,
                 fg_color=gl_bg,
                 corner_radius=10,
                 height=22,
+                cursor="" if gl_r.ready else "hand2",
             )
             gl_pill.grid(
                 row=0,
@@ -991,7 +1370,7 @@ class DLCFrame(ctk.CTkFrame):
                 tip = ctk.CTkLabel(
                     w.winfo_toplevel(),
                     text=f"  {txt}  ",
-                    font=ctk.CTkFont(size=10),
+                    font=_font(10),
                     text_color=clr,
                     fg_color=theme.COLORS["bg_dark"],
                     corner_radius=6,
@@ -1014,7 +1393,6 @@ class DLCFrame(ctk.CTkFrame):
 
             # Incomplete GL pills are clickable — navigate to GreenLuma tab
             if not gl_r.ready:
-                gl_pill.configure(cursor="hand2")
                 gl_pill.bind(
                     "<Button-1>",
                     lambda e: self.app._show_frame("greenluma"),
@@ -1030,7 +1408,7 @@ class DLCFrame(ctk.CTkFrame):
                 text="\u2716",
                 width=28,
                 height=24,
-                font=ctk.CTkFont(size=12),
+                font=_font(12),
                 fg_color=theme.COLORS["error"],
                 hover_color=theme.COLORS["hover_cancel"],
                 text_color=theme.COLORS["text_bright"],
@@ -1046,90 +1424,117 @@ class DLCFrame(ctk.CTkFrame):
             )
             next_col += 1
 
-        # Hover effect — animate border color
-        def on_enter(e, rf=row_frame):
-            self._animator.cancel_all(rf, tag="row_hover")
-            self._animator.animate_color(
-                rf,
-                "border_color",
-                theme.COLORS["border"],
-                theme.COLORS["accent"],
-                theme.ANIM_FAST,
-                tag="row_hover",
-            )
+        # Hover effect — animate border color. The row and all of its Tk
+        # descendants carry the shared bindtag, so no per-widget bindings.
+        row_frame._hover_tag = dlc.id
+        self._add_hover_tag(row_frame)
 
-        def on_leave(e, rf=row_frame, rw_ref=dlc.id):
-            self._animator.cancel_all(rf, tag="row_hover")
-            self._animator.animate_color(
-                rf,
-                "border_color",
-                theme.COLORS["accent"],
-                theme.COLORS["border"],
-                theme.ANIM_NORMAL,
-                tag="row_hover",
-            )
+        # Description frame is built lazily on first expansion — most rows
+        # are never expanded, so building it up front only adds hidden widgets.
+        desc_builder = None
+        if has_desc:
+            desc_builder = functools.partial(self._build_desc_frame, parent, dlc, wrap)
 
-        row_frame.bind("<Enter>", on_enter)
-        row_frame.bind("<Leave>", on_leave)
-        # Propagate hover to children
-        for child in row_frame.winfo_children():
-            child.bind("<Enter>", on_enter)
-            child.bind("<Leave>", on_leave)
+        # Store references
+        self._row_widgets[dlc.id] = _RowWidgets(
+            row_frame=row_frame,
+            info_btn=info_btn,
+            checkbox=cb,
+            uninstall_btn=uninstall_btn,
+            bg_normal=bg,
+            desc_builder=desc_builder,
+            signature=self._row_signature(state),
+        )
 
-        # Description frame (hidden by default)
-        desc_frame = None
-        if has_desc:
-            desc_frame = ctk.CTkFrame(
-                parent,
-                fg_color=theme.COLORS["bg_card_alt"],
-                corner_radius=4,
+    @classmethod
+    def _add_hover_tag(cls, widget):
+        widget.bindtags((_ROW_HOVER_TAG, *widget.bindtags()))
+        for child in widget.winfo_children():
+            cls._add_hover_tag(child)
+
+    @staticmethod
+    def _hover_row(widget):
+        """Walk up from an event widget to the DLC row frame that owns it."""
+        while widget is not None:
+            if getattr(widget, "_hover_tag", None) is not None:
+                return widget
+            widget = getattr(widget, "master", None)
+        return None
+
+    def _on_row_enter(self, event):
+        rf = self._hover_row(event.widget)
+        if rf is None:
+            return
+        self._animator.cancel_all(rf, tag="row_hover")
+        self._animator.animate_color(
+            rf,
+            "border_color",
+            _BORDER,
+            _ACCENT,
+            theme.ANIM_FAST,
+            tag="row_hover",
+        )
+
+    def _on_row_leave(self, event):
+        rf = self._hover_row(event.widget)
+        if rf is None:
+            return
+        self._animator.cancel_all(rf, tag="row_hover")
+        self._animator.animate_color(
+            rf,
+            "border_color",
+            _ACCENT,
+            _BORDER,
+            theme.ANIM_NORMAL,
+            tag="row_hover",
+        )
+
+    def _build_desc_frame(self, parent, dlc: DLCInfo, wrap: int) -> ctk.CTkFrame:
+        """Build the expandable description panel shown under a DLC row."""
+        price = self._get_price(dlc)
+        desc_frame = ctk.CTkFrame(
+            parent,
+            fg_color=_BG_CARD_ALT,
+            corner_radius=4,
+        )
+        desc_frame.grid_columnconfigure(0, weight=1)
+
+        ctk.CTkLabel(
+            desc_frame,
+            text=dlc.description,
+            font=theme_font(theme.FONT_SMALL),
+            text_color=_TEXT_MUTED,
+            wraplength=wrap,
+            justify="left",
+            anchor="w",
+        ).grid(row=0, column=0, padx=10, pady=6, sticky="w")
+
+        if dlc.steam_app_id:
+            steam_link = ctk.CTkLabel(
+                desc_frame,
+                text="View on Steam Store \u2197",
+                font=_font(10, underline=True),
+                text_color=_ACCENT,
+                cursor="hand2",
+            )
+            steam_link.grid(row=1, column=0, padx=10, pady=(0, 6), sticky="w")
+            steam_link.bind(
+                "<Button-1>",
+                lambda e, aid=dlc.steam_app_id: self._open_steam_page(aid),
             )
-            desc_frame.grid_columnconfigure(0, weight=1)
 
+        if price and price.on_sale:
             ctk.CTkLabel(
                 desc_frame,
-                text=dlc.description,
-                font=ctk.CTkFont(*theme.FONT_SMALL),
-                text_color=theme.COLORS["text_muted"],
-                wraplength=wrap,
-                justify="left",
-                anchor="w",
-            ).grid(row=0, column=0, padx=10, pady=6, sticky="w")
-
-            if dlc.steam_app_id:
-                steam_link = ctk.CTkLabel(
-                    desc_frame,
-                    text="View on Steam Store \u2197",
-                    font=ctk.CTkFont(size=10, underline=True),
-                    text_color=theme.COLORS["accent"],
-                    cursor="hand2",
-                )
-                steam_link.grid(row=1, column=0, padx=10, pady=(0, 6), sticky="w")
-                steam_link.bind(
-                    "<Button-1>",
-                    lambda e, aid=dlc.steam_app_id: self._open_steam_page(aid),
-                )
-
-            if price and price.on_sale:
-                ctk.CTkLabel(
-                    desc_frame,
-                    text=(
-                        f"Steam Sale: {price.initial_formatted} \u2192 "
-                        f"{price.final_formatted} ({price.discount_percent}% off)"
-                    ),
-                    font=ctk.CTkFont(size=10, weight="bold"),
-                    text_color=theme.COLORS["success"],
-                ).grid(row=2, column=0, padx=10, pady=(0, 6), sticky="w")
+                text=(
+                    f"Steam Sale: {price.initial_formatted} \u2192 "
+                    f"{price.final_formatted} ({price.discount_percent}% off)"
+                ),
+                font=_font(10, "bold"),
+                text_color=_SUCCESS,
+            ).grid(row=2, column=0, padx=10, pady=(0, 6), sticky="w")
 
-        # Store references
-        self._row_widgets[dlc.id] = {
-            "row_frame": row_frame,
-            "desc_frame": desc_frame,
-            "info_btn": info_btn,
-            "checkbox": cb,
-            "uninstall_btn": uninstall_btn,
-            "_bg_normal": bg,
-        }
+        return desc_frame
 
     # ── Pending DLCs ──────────────────────────────────────────
 
@@ -1144,7 +1549,7 @@ class DLCFrame(ctk.CTkFrame):
         sep = ctk.CTkFrame(
             self._scroll_frame,
             height=1,
-            fg_color=theme.COLORS["separator"],
+            fg_color=_SEPARATOR,
         )
         sep.grid(row=row, column=0, padx=5, pady=(8, 0), sticky="ew")
         self._pending_widgets.append(sep)
@@ -1153,8 +1558,8 @@ class DLCFrame(ctk.CTkFrame):
         header = ctk.CTkLabel(
             self._scroll_frame,
             text="\u25cf  Pending (Patch Not Yet Available)",
-            font=ctk.CTkFont(size=13, weight="bold"),
-            text_color=theme.COLORS["warning"],
+            font=_font(13, "bold"),
+            text_color=_WARNING,
         )
         header.grid(row=row, column=0, padx=5, pady=(10, 4), sticky="w")
         self._pending_widgets.append(header)
@@ -1164,8 +1569,8 @@ class DLCFrame(ctk.CTkFrame):
             lbl = ctk.CTkLabel(
                 self._scroll_frame,
                 text=f"    {pending.name}  [PENDING]",
-                font=ctk.CTkFont(size=12),
-                text_color=theme.COLORS["text_muted"],
+                font=_font(12),
+                text_color=_TEXT_MUTED,
             )
             lbl.grid(row=row, column=0, padx=15, pady=1, sticky="w")
             self._pending_widgets.append(lbl)
@@ -1179,12 +1584,31 @@ class DLCFrame(ctk.CTkFrame):
         if rw is None:
             return
 
-        btn = rw.get("info_btn")
+        btn = rw.info_btn
         if btn:
             btn.configure(text="\u25bc" if self._desc_expanded[dlc_id] else "\u25b8")
 
-        # Re-run filter layout — it knows the correct grid positions
-        self._apply_filter()
+        # Only this row's panel changes — its grid slot is reserved, so there
+        # is no need to re-lay out the whole list
+        if self._desc_expanded[dlc_id]:
+            if rw.desc_frame is None and rw.desc_builder:
+                rw.desc_frame = rw.desc_builder()
+            # Mid-rebuild the row isn't placed yet; the filter grids it when done
+            if rw.desc_frame is not None and self._built:
+                self._grid_desc(rw)
+        elif rw.desc_frame is not None:
+            rw.desc_frame.grid_remove()
+
+    @staticmethod
+    def _grid_desc(rw: _RowWidgets):
+        """Place a row's description panel in the grid slot reserved below it."""
+        rw.desc_frame.grid(
+            row=rw.grid_row + 1,
+            column=0,
+            padx=(35, 10),
+            pady=(0, 2),
+            sticky="ew",
+        )
 
     def _toggle_section(self, pack_type: str):
         self._section_collapsed[pack_type] = not self._section_collapsed.get(pack_type, False)
@@ -1193,12 +1617,19 @@ class DLCFrame(ctk.CTkFrame):
             return
 
         is_collapsed = self._section_collapsed[pack_type]
-        sw["arrow_label"].configure(text="\u25b6" if is_collapsed else "\u25bc")
+        sw.arrow_label.configure(text="\u25b6" if is_collapsed else "\u25bc")
 
         if is_collapsed:
-            sw["content_frame"].grid_remove()
+            sw.content_frame.grid_remove()
         else:
-            sw["content_frame"].grid()
+            if not sw.rows_built:
+                wrap = max(300, self._scroll_frame.winfo_width() - 80)
+                for _ in self._build_section_rows(pack_type, sw, wrap):
+                    pass
+            # Rows in a collapsed section aren't re-laid out by the filter, so
+            # they may be stale — let the next layout pass place them
+            self._last_filter_key = None
+            self._schedule_layout()
 
     def _open_steam_page(self, app_id: int):
         webbrowser.open(f"https://store.steampowered.com/app/{app_id}")
@@ -1210,12 +1641,13 @@ class DLCFrame(ctk.CTkFrame):
         self._status_label.configure(text="Auto-toggling...")
         self.app.run_async(
             self._auto_toggle_bg,
+            self._game_dir,
             on_done=self._on_auto_done,
             on_error=self._on_dlc_error,
         )
 
-    def _auto_toggle_bg(self):
-        game_dir = self.app.updater.find_game_dir()
+    def _auto_toggle_bg(self, game_dir: str | None):
+        game_dir = game_dir or self.app.updater.find_game_dir()
         if not game_dir:
             return {}
         return self.app.updater._dlc_manager.auto_toggle(game_dir)
@@ -1235,22 +1667,51 @@ class DLCFrame(ctk.CTkFrame):
             self.app.show_toast("All DLCs already correctly configured", "success")
 
     def _on_apply(self):
+        if not self._built:
+            return  # checkbox vars are incomplete until the row build finishes
+
+        checked = {dlc_id: var.get() for dlc_id, var in self._checkbox_vars.items()}
+        enabled_set, config_enabled = self._apply_sets(self._all_states, checked)
+        if enabled_set == config_enabled:
+            # The config already matches the checkboxes — skip the rewrite
+            self.app.show_toast("No changes to apply", "info")
+            return
+
         self._apply_btn.configure(state="disabled")
         self._status_label.configure(text="Applying changes...")
-
-        enabled_set = {dlc_id for dlc_id, var in self._checkbox_vars.items() if var.get()}
         # Snapshot current state for telemetry diff
-        self._pre_apply_enabled = {s.dlc.id for s in self._all_states if s.enabled is True}
+        self._pre_apply_enabled = config_enabled
         self._apply_enabled_set = enabled_set
         self.app.run_async(
             self._apply_bg,
+            self._game_dir,
             enabled_set,
             on_done=self._on_apply_done,
             on_error=self._on_dlc_error,
         )
 
-    def _apply_bg(self, enabled_set):
-        game_dir = self.app.updater.find_game_dir()
+    @classmethod
+    def _apply_sets(
+        cls, states: list[DLCStatus], checked: dict[str, bool]
+    ) -> tuple[set[str], set[str]]:
+        """Return (DLC ids the checkboxes enable, DLC ids the crack config enables).
+
+        DLCs without a checkbox value (rows of never-expanded sections) keep
+        what their row would show on load. Apply rewrites every DLC in the
+        config, so it is only a no-op when the two sets are equal.
+        """
+        enabled_set = set()
+        config_enabled = set()
+        for s in states:
+            dlc_id = s.dlc.id
+            if s.enabled is True:
+                config_enabled.add(dlc_id)
+            if checked.get(dlc_id, cls._initially_checked(s)):
+                enabled_set.add(dlc_id)
+        return enabled_set, config_enabled
+
+    def _apply_bg(self, game_dir: str | None, enabled_set):
+        game_dir = game_dir or self.app.updater.find_game_dir()
         if not game_dir:
             return
         self.app.updater._dlc_manager.apply_changes(game_dir, enabled_set)
@@ -1286,13 +1747,10 @@ class DLCFrame(ctk.CTkFrame):
         self._on_dlc_error(error)
 
     def _on_dlc_error(self, error):
-        import logging
-        import traceback
-
-        # Use the exception's own __traceback__ — format_exc() would return nothing
-        # because this callback runs on the GUI thread with no active exception.
-        tb = "".join(traceback.format_exception(type(error), error, error.__traceback__))
-        logging.error("DLC error: %s\n%s", error, tb)
+        # Pass the exception itself — format_exc() would return nothing because this
+        # callback runs on the GUI thread with no active exception. Logging only
+        # formats the traceback if the record is actually emitted.
+        logger.error("DLC error: %s", error, exc_info=error)
         self._auto_btn.configure(state="normal")
         self._apply_btn.configure(state="normal")
         self._status_label.configure(
@@ -1321,12 +1779,13 @@ class DLCFrame(ctk.CTkFrame):
         if not dlc_downloads:
             return
         self._dlc_downloads = dlc_downloads
+        self._index_filter_masks()
 
         # Update Downloadable chip label with count
         downloadable_count = sum(
             1
             for s in self._all_states
-            if s.dlc.id in dlc_downloads and s.status_label in _DOWNLOADABLE_STATUSES
+            if s.dlc.id in dlc_downloads and self._row_meta[s.dlc.id][0] in _DOWNLOADABLE_STATUSES
         )
         btn = self._filter_buttons.get("downloadable")
         if btn:
@@ -1346,9 +1805,7 @@ class DLCFrame(ctk.CTkFrame):
         self._apply_filter()
 
     def _on_dlc_downloads_error(self, error):
-        import logging
-
-        logging.warning("Could not load DLC downloads from manifest: %s", error)
+        logger.warning("Could not load DLC downloads from manifest: %s", error)
         # Hide the button since we have no download data
         self._go_to_downloader_btn.grid_remove()
 
@@ -1370,18 +1827,20 @@ class DLCFrame(ctk.CTkFrame):
 
         # Disable the uninstall button to prevent double-clicks
         rw = self._row_widgets.get(dlc_id)
-        if rw and rw.get("uninstall_btn"):
-            rw["uninstall_btn"].configure(state="disabled", text="...")
+        if rw and rw.uninstall_btn:
+            rw.uninstall_btn.configure(state="disabled", text="...")
+            rw.signature = ()  # force a fresh row on reload, even if removal failed
 
         self.app.run_async(
             self._uninstall_bg,
+            self._game_dir,
             dlc_id,
             on_done=lambda r: self._on_uninstall_done(dlc_id, dlc_name, r),
             on_error=self._on_dlc_error,
         )
 
-    def _uninstall_bg(self, dlc_id: str):
-        game_dir = self.app.updater.find_game_dir()
+    def _uninstall_bg(self, game_dir: str | None, dlc_id: str):
+        game_dir = game_dir or self.app.updater.find_game_dir()
         if not game_dir:
             return (0, 0)
         return self.app.updater._dlc_manager.uninstall_dlc(game_dir, dlc_id)
@@ -6,17 +6,24 @@ speed limiting, pause/resume, and an activity log.
 from __future__ import annotations
 
 import contextlib
+import functools
+import os
+import queue
 import threading
 import time
-from datetime import datetime
+from collections import Counter, defaultdict, deque
+from dataclasses import dataclass
+from operator import itemgetter
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 import customtkinter as ctk
 
 from .. import theme
-from ..components import InfoCard, StatusBadge
+from ..components import InfoCard, StatusBadge, theme_font
 
 if TYPE_CHECKING:
+    from ...dlc.catalog import DLCInfo
     from ..app import App
 
 from ...dlc.downloader import (
@@ -24,26 +31,52 @@ from ...dlc.downloader import (
     DLCDownloadTask,
     ParallelDLCDownloader,
 )
-from ...patch.manifest import DLCDownloadEntry
+from ...patch.manifest import DLCDownloadEntry, Manifest
+
+# Theme colors, resolved once at import instead of per widget
+_ACCENT = theme.COLORS["accent"]
+_ACCENT_HOVER = theme.COLORS["accent_hover"]
+_BG_CARD = theme.COLORS["bg_card"]
+_BG_CARD_ALT = theme.COLORS["bg_card_alt"]
+_BG_DARK = theme.COLORS["bg_dark"]
+_BG_DEEPER = theme.COLORS["bg_deeper"]
+_BORDER = theme.COLORS["border"]
+_CARD_HOVER = theme.COLORS["card_hover"]
+_ERROR = theme.COLORS["error"]
+_HOVER_ERROR = theme.COLORS["hover_error"]
+_SUCCESS = theme.COLORS["success"]
+_TEXT = theme.COLORS["text"]
+_TEXT_DIM = theme.COLORS["text_dim"]
+_TEXT_MUTED = theme.COLORS["text_muted"]
 
 # ── helpers ────────────────────────────────────────────────────────
 
 
+# (unit size, format) rows, largest first; values below the last row print raw
+_SIZE_UNITS = (
+    (1_073_741_824, "{:.1f} GB"),
+    (1_048_576, "{:.0f} MB"),
+    (1024, "{:.0f} KB"),
+)
+_SPEED_UNITS = (
+    (1_048_576, "{:.1f} MB/s"),
+    (1024, "{:.0f} KB/s"),
+)
+
+
+@functools.lru_cache(maxsize=512)
 def _format_size(size_bytes: int) -> str:
-    if size_bytes >= 1_073_741_824:
-        return f"{size_bytes / 1_073_741_824:.1f} GB"
-    if size_bytes >= 1_048_576:
-        return f"{size_bytes / 1_048_576:.0f} MB"
-    if size_bytes >= 1024:
-        return f"{size_bytes / 1024:.0f} KB"
+    # Cached: totals and manifest sizes are formatted on every progress tick
+    for unit, fmt in _SIZE_UNITS:
+        if size_bytes >= unit:
+            return fmt.format(size_bytes / unit)
     return f"{size_bytes} B"
 
 
 def _format_speed(bps: float) -> str:
-    if bps >= 1_048_576:
-        return f"{bps / 1_048_576:.1f} MB/s"
-    if bps >= 1024:
-        return f"{bps / 1024:.0f} KB/s"
+    for unit, fmt in _SPEED_UNITS:
+        if bps >= unit:
+            return fmt.format(bps / unit)
     return f"{bps:.0f} B/s"
 
 
@@ -59,9 +92,40 @@ def _format_eta(seconds: float | None) -> str:
     return f"ETA {s}s"
 
 
+@functools.lru_cache(maxsize=1)
+def _format_clock(epoch_second: int) -> str:
+    return time.strftime("%H:%M:%S", time.localtime(epoch_second))
+
+
 def _timestamp() -> str:
-    return datetime.now().strftime("%H:%M:%S")
+    """HH:MM:SS for the log, formatted at most once per wall-clock second."""
+    return _format_clock(int(time.time()))
+
+
+# Download states after which a DLC's row receives no more updates
+_FINAL_STATES = frozenset(
+    {
+        DLCDownloadState.COMPLETED,
+        DLCDownloadState.EXTRACTED,
+        DLCDownloadState.FAILED,
+        DLCDownloadState.CANCELLED,
+    }
+)
 
+# Minimum gap between forwarded DOWNLOADING events for one DLC
+_PROGRESS_INTERVAL_MS = 150
+# ...and below this many new bytes, at most this often
+_PROGRESS_MIN_BYTES = 65_536
+_PROGRESS_MAX_INTERVAL_MS = 1000
+# How often the GUI thread drains queued progress events
+_PROGRESS_POLL_MS = 100
+# Speed/ETA in the overall label refresh this often between state changes
+_OVERALL_LABEL_MS = 1000
+
+# Activity log lines are batched and written at most this often
+_LOG_FLUSH_MS = 200
+# Oldest activity log lines are dropped beyond this many
+_LOG_MAX_LINES = 2000
 
 # DLC pack-type display order
 _TYPE_ORDER = ["expansion", "game_pack", "stuff_pack", "kit", "free_pack", "other"]
@@ -78,10 +142,12 @@ _TYPE_LABELS = {
 class _SpeedTracker:
     """Sliding-window speed calculator for download progress."""
 
-    WINDOW = 3.0  # seconds
+    WINDOW_NS = 3_000_000_000  # 3 seconds
+    MAX_SAMPLES = 64  # bounds memory if updates arrive faster than expected
 
     def __init__(self) -> None:
-        self._samples: list[tuple[float, int]] = []
+        # (monotonic_ns, cumulative bytes) — integer math throughout
+        self._samples: deque[tuple[int, int]] = deque(maxlen=self.MAX_SAMPLES)
         self._total_size = 0
 
     def reset(self, total_size: int = 0) -> None:
@@ -89,19 +155,19 @@ class _SpeedTracker:
         self._total_size = total_size
 
     def update(self, cumulative_bytes: int) -> None:
-        now = time.monotonic()
+        now = time.monotonic_ns()
         self._samples.append((now, cumulative_bytes))
-        cutoff = now - self.WINDOW
+        cutoff = now - self.WINDOW_NS
         while self._samples and self._samples[0][0] < cutoff:
-            self._samples.pop(0)
+            self._samples.popleft()
 
     @property
     def speed_bps(self) -> float:
         if len(self._samples) < 2:
             return 0.0
-        dt = self._samples[-1][0] - self._samples[0][0]
+        dt_ns = self._samples[-1][0] - self._samples[0][0]
         db = self._samples[-1][1] - self._samples[0][1]
-        return db / dt if dt > 0 else 0.0
+        return db * 1_000_000_000 / dt_ns if dt_ns > 0 else 0.0
 
     @property
     def eta_seconds(self) -> float | None:
@@ -112,6 +178,76 @@ class _SpeedTracker:
         return max(0, remaining / speed) if remaining > 0 else 0
 
 
+@dataclass(slots=True)
+class _RowWidgets:
+    """Widgets and bookkeeping for one DLC row."""
+
+    row_frame: ctk.CTkFrame
+    checkbox: ctk.CTkCheckBox
+    badge: StatusBadge
+    size_label: ctk.CTkLabel
+    progress_bar: ctk.CTkProgressBar
+    state_label: ctk.CTkLabel
+    speed_tracker: _SpeedTracker
+    grid_row: int = 0
+    signature: tuple = ()  # _row_signature() when last styled
+    progress: float = 0.0  # last value written to progress_bar
+
+
+def _set_row_progress(rw: _RowWidgets, value: float):
+    """Set a row's progress bar, skipping changes below 0.1%."""
+    value = round(value * 1000) / 1000
+    if value != rw.progress:
+        rw.progress = value
+        rw.progress_bar.set(value)
+
+
+@dataclass(slots=True)
+class _DownloadSummary:
+    """Batch totals, reduced on the download worker before the GUI sees them."""
+
+    completed: int
+    extracted: int
+    failed: int
+    cancelled: int
+    total_bytes: int  # sizes of completed + extracted DLCs
+    duration: float
+    total_retries: int
+    dlc_ids: list[str]  # every DLC that was not cancelled
+
+    @classmethod
+    def from_results(cls, results: list[DLCDownloadTask], start_time: float) -> _DownloadSummary:
+        counts = Counter(r.state for r in results)
+        ok_states = (DLCDownloadState.COMPLETED, DLCDownloadState.EXTRACTED)
+        return cls(
+            completed=counts[DLCDownloadState.COMPLETED],
+            extracted=counts[DLCDownloadState.EXTRACTED],
+            failed=counts[DLCDownloadState.FAILED],
+            cancelled=counts[DLCDownloadState.CANCELLED],
+            total_bytes=sum(r.entry.size for r in results if r.state in ok_states),
+            duration=time.monotonic() - start_time,
+            total_retries=sum(
+                r.retry_count
+                for r in results
+                if r.state in ok_states or r.state == DLCDownloadState.FAILED
+            ),
+            dlc_ids=[r.entry.dlc_id for r in results if r.state != DLCDownloadState.CANCELLED],
+        )
+
+    @property
+    def text(self) -> str:
+        parts = []
+        if self.completed:
+            parts.append(f"{self.completed} installed")
+        if self.extracted:
+            parts.append(f"{self.extracted} extracted")
+        if self.failed:
+            parts.append(f"{self.failed} failed")
+        if self.cancelled:
+            parts.append(f"{self.cancelled} cancelled")
+        return ", ".join(parts) or "No DLCs processed"
+
+
 class DownloaderFrame(ctk.CTkFrame):
     """Dedicated DLC download tab with parallel downloads, speed control, and log."""
 
@@ -124,33 +260,79 @@ class DownloaderFrame(ctk.CTkFrame):
         self._cancel_event = threading.Event()
         self._dlc_downloads: dict[str, DLCDownloadEntry] = {}
         self._installed_ids: set[str] = set()
-        self._cached_ids: set[str] = set()
+        self._selectable_ids: set[str] = set()  # in the manifest, not installed
+        self._cached_ids: frozenset[str] = frozenset()  # replaced wholesale per scan
         self._dlc_vars: dict[str, ctk.BooleanVar] = {}
-        self._row_widgets: dict[str, dict] = {}
+        self._row_widgets: dict[str, _RowWidgets] = {}
+        self._section_headers: dict[str, ctk.CTkLabel] = {}  # pack type -> header
+        self._row_pool: list[_RowWidgets] = []  # unmapped rows awaiting reuse
         self._download_thread: threading.Thread | None = None
         self._game_dir: str | None = None
-        self._last_progress_time: dict[str, float] = {}
+        # dlc_id -> (monotonic ms, bytes) of the last forwarded DOWNLOADING event
+        self._last_progress: dict[str, tuple[int, int]] = {}
+        self._active_progress_ids: set[str] = set()  # DLCs not yet in a final state
         self._total_to_download = 0
         self._completed_count = 0
         self._failed_count = 0
         self._extracted_count = 0
+        self._done_count = 0  # completed + failed + extracted
         self._active_downloader: ParallelDLCDownloader | None = None
         self._dl_lock = threading.Lock()  # guards _active_downloader
+        # Progress events from download workers, drained on the GUI thread
+        self._progress_q: queue.SimpleQueue = queue.SimpleQueue()
+        self._progress_after_id: str | None = None
+        # Activity log lines waiting for the next batched insert
+        # Capped: lines beyond _LOG_MAX_LINES would be trimmed from the box anyway
+        self._log_buffer: deque[str] = deque(maxlen=_LOG_MAX_LINES)
+        self._log_flush_pending = False
+        self._log_lock = threading.Lock()  # guards the two above
+        self._log_line_count = 0  # lines currently in _log_box
         self._selected_version: str | None = None  # None = latest
+        # Scan caches (archived manifests are immutable per version; the
+        # dlcs/ listing is keyed by the directory's mtime)
+        self._version_manifests: dict[str, Manifest] = {}
+        self._dir_listing: tuple[tuple[Path, int], set[str]] | None = None
+        self._version_choices_cache: tuple[Manifest, list[str]] | None = None
 
         # Speed / timing
         self._overall_tracker = _SpeedTracker()
         self._dlc_bytes: dict[str, int] = {}  # per-DLC cumulative bytes
+        self._dlc_bytes_total = 0  # running sum of _dlc_bytes
         self._dlc_start_times: dict[str, float] = {}
         self._download_start_time: float = 0.0
         self._download_entries: list[DLCDownloadEntry] = []
+        self._dlc_info: dict[str, DLCInfo | None] = {}  # catalog info per session DLC
+        self._dlc_start_msg: dict[str, str] = {}  # pre-rendered "Downloading ..." lines
+        self._total_download_size = 0  # sum of entry sizes for the session
+        self._last_overall_progress = 0.0  # last value written to _overall_progress
+        self._overall_label_ms = 0  # monotonic ms of the last overall label write
         self._logged_dl_start: set[str] = set()  # DLC IDs already logged "Downloading..."
+        self._state_handlers = {
+            DLCDownloadState.DOWNLOADING: self._on_dlc_downloading,
+            DLCDownloadState.EXTRACTING: self._on_dlc_extracting,
+            DLCDownloadState.REGISTERING: self._on_dlc_registering,
+            DLCDownloadState.COMPLETED: self._on_dlc_completed,
+            DLCDownloadState.EXTRACTED: self._on_dlc_extracted,
+            DLCDownloadState.FAILED: self._on_dlc_failed,
+            DLCDownloadState.CANCELLED: self._on_dlc_cancelled,
+        }
 
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(2, weight=1)  # scroll area stretches
 
         self._build_ui()
 
+    def destroy(self):
+        # The download thread is a daemon, but download_parallel's own worker
+        # pool is joined at interpreter exit. cancel() also wakes paused
+        # workers, which the updater's cancel flag set in App._on_close alone
+        # would leave blocked, so closing mid-download can't hang exit.
+        with self._dl_lock:
+            dl = self._active_downloader
+        if dl:
+            dl.cancel()
+        super().destroy()
+
     # ── UI Construction ───────────────────────────────────────────
 
     def _build_ui(self):
@@ -162,27 +344,27 @@ class DownloaderFrame(ctk.CTkFrame):
         ctk.CTkLabel(
             top,
             text="DLC Downloader",
-            font=ctk.CTkFont(*theme.FONT_HEADING),
-            text_color=theme.COLORS["text"],
+            font=theme_font(theme.FONT_HEADING),
+            text_color=_TEXT,
         ).grid(row=0, column=0, sticky="w")
 
         ctk.CTkLabel(
             top,
             text="Download and install DLC packs from the CDN server",
-            font=ctk.CTkFont(*theme.FONT_SMALL),
-            text_color=theme.COLORS["text_muted"],
+            font=theme_font(theme.FONT_SMALL),
+            text_color=_TEXT_MUTED,
         ).grid(row=1, column=0, sticky="w", pady=(0, 8))
 
         # Settings card
-        card = InfoCard(top, fg_color=theme.COLORS["bg_card"])
+        card = InfoCard(top, fg_color=_BG_CARD)
         card.grid(row=2, column=0, sticky="ew", pady=(0, 6))
         card.grid_columnconfigure(1, weight=1)
 
         ctk.CTkLabel(
             card,
             text="Parallel Downloads",
-            font=ctk.CTkFont(*theme.FONT_BODY),
-            text_color=theme.COLORS["text"],
+            font=theme_font(theme.FONT_BODY),
+            text_color=_TEXT,
         ).grid(
             row=0,
             column=0,
@@ -201,16 +383,16 @@ class DownloaderFrame(ctk.CTkFrame):
             width=70,
             height=theme.BUTTON_HEIGHT_SMALL,
             corner_radius=theme.CORNER_RADIUS_SMALL,
-            fg_color=theme.COLORS["bg_card_alt"],
-            button_color=theme.COLORS["bg_card_alt"],
-            button_hover_color=theme.COLORS["card_hover"],
+            fg_color=_BG_CARD_ALT,
+            button_color=_BG_CARD_ALT,
+            button_hover_color=_CARD_HOVER,
         ).grid(row=0, column=1, padx=0, pady=(theme.CARD_PAD_Y, 4), sticky="w")
 
         ctk.CTkLabel(
             card,
             text="Speed Limit",
-            font=ctk.CTkFont(*theme.FONT_BODY),
-            text_color=theme.COLORS["text"],
+            font=theme_font(theme.FONT_BODY),
+            text_color=_TEXT,
         ).grid(
             row=1,
             column=0,
@@ -237,24 +419,24 @@ class DownloaderFrame(ctk.CTkFrame):
             width=70,
             height=theme.BUTTON_HEIGHT_SMALL,
             corner_radius=theme.CORNER_RADIUS_SMALL,
-            fg_color=theme.COLORS["bg_card_alt"],
-            border_color=theme.COLORS["border"],
+            fg_color=_BG_CARD_ALT,
+            border_color=_BORDER,
             placeholder_text="0",
         ).pack(side="left")
 
         ctk.CTkLabel(
             speed_frame,
             text="MB/s  (0 = unlimited)",
-            font=ctk.CTkFont(*theme.FONT_SMALL),
-            text_color=theme.COLORS["text_muted"],
+            font=theme_font(theme.FONT_SMALL),
+            text_color=_TEXT_MUTED,
         ).pack(side="left", padx=(6, 0))
 
         # Content version picker
         ctk.CTkLabel(
             card,
             text="Content Version",
-            font=ctk.CTkFont(*theme.FONT_BODY),
-            text_color=theme.COLORS["text"],
+            font=theme_font(theme.FONT_BODY),
+            text_color=_TEXT,
         ).grid(
             row=2,
             column=0,
@@ -271,9 +453,9 @@ class DownloaderFrame(ctk.CTkFrame):
             width=220,
             height=theme.BUTTON_HEIGHT_SMALL,
             corner_radius=theme.CORNER_RADIUS_SMALL,
-            fg_color=theme.COLORS["bg_card_alt"],
-            button_color=theme.COLORS["bg_card_alt"],
-            button_hover_color=theme.COLORS["card_hover"],
+            fg_color=_BG_CARD_ALT,
+            button_color=_BG_CARD_ALT,
+            button_hover_color=_CARD_HOVER,
             command=self._on_version_changed,
         )
         self._version_menu.grid(
@@ -297,8 +479,8 @@ class DownloaderFrame(ctk.CTkFrame):
         self._select_missing_btn = ctk.CTkButton(
             bar,
             text="Select Missing",
-            fg_color=theme.COLORS["bg_card_alt"],
-            hover_color=theme.COLORS["card_hover"],
+            fg_color=_BG_CARD_ALT,
+            hover_color=_CARD_HOVER,
             command=self._select_missing,
             **btn_kw,
         )
@@ -307,8 +489,8 @@ class DownloaderFrame(ctk.CTkFrame):
         self._deselect_all_btn = ctk.CTkButton(
             bar,
             text="Deselect All",
-            fg_color=theme.COLORS["bg_card_alt"],
-            hover_color=theme.COLORS["card_hover"],
+            fg_color=_BG_CARD_ALT,
+            hover_color=_CARD_HOVER,
             command=self._deselect_all,
             **btn_kw,
         )
@@ -317,8 +499,8 @@ class DownloaderFrame(ctk.CTkFrame):
         self._download_btn = ctk.CTkButton(
             bar,
             text="Download Selected",
-            fg_color=theme.COLORS["accent"],
-            hover_color=theme.COLORS["accent_hover"],
+            fg_color=_ACCENT,
+            hover_color=_ACCENT_HOVER,
             command=self._on_download_selected,
             **btn_kw,
         )
@@ -328,8 +510,8 @@ class DownloaderFrame(ctk.CTkFrame):
         self._pause_btn = ctk.CTkButton(
             bar,
             text="Pause",
-            fg_color=theme.COLORS["bg_card_alt"],
-            hover_color=theme.COLORS["card_hover"],
+            fg_color=_BG_CARD_ALT,
+            hover_color=_CARD_HOVER,
             command=self._on_pause,
             **btn_kw,
         )
@@ -340,8 +522,8 @@ class DownloaderFrame(ctk.CTkFrame):
         self._resume_btn = ctk.CTkButton(
             bar,
             text="Resume",
-            fg_color=theme.COLORS["accent"],
-            hover_color=theme.COLORS["accent_hover"],
+            fg_color=_ACCENT,
+            hover_color=_ACCENT_HOVER,
             command=self._on_resume,
             **btn_kw,
         )
@@ -352,8 +534,8 @@ class DownloaderFrame(ctk.CTkFrame):
         self._cancel_btn = ctk.CTkButton(
             bar,
             text="Cancel",
-            fg_color=theme.COLORS["error"],
-            hover_color=theme.COLORS["hover_error"],
+            fg_color=_ERROR,
+            hover_color=_HOVER_ERROR,
             command=self._on_cancel,
             **btn_kw,
         )
@@ -363,10 +545,10 @@ class DownloaderFrame(ctk.CTkFrame):
         # Row 2 — Scrollable DLC list
         self._scroll_frame = ctk.CTkScrollableFrame(
             self,
-            fg_color=theme.COLORS["bg_dark"],
+            fg_color=_BG_DARK,
             corner_radius=theme.CORNER_RADIUS,
             border_width=1,
-            border_color=theme.COLORS["border"],
+            border_color=_BORDER,
         )
         self._scroll_frame.grid(
             row=2,
@@ -381,20 +563,20 @@ class DownloaderFrame(ctk.CTkFrame):
         self._no_manifest_label = ctk.CTkLabel(
             self._scroll_frame,
             text="Configure a manifest URL in Settings to see available DLCs.",
-            font=ctk.CTkFont(*theme.FONT_BODY),
-            text_color=theme.COLORS["text_muted"],
+            font=theme_font(theme.FONT_BODY),
+            text_color=_TEXT_MUTED,
         )
         self._loading_label = ctk.CTkLabel(
             self._scroll_frame,
             text="Loading DLC list...",
-            font=ctk.CTkFont(*theme.FONT_BODY),
-            text_color=theme.COLORS["text_muted"],
+            font=theme_font(theme.FONT_BODY),
+            text_color=_TEXT_MUTED,
         )
         self._empty_label = ctk.CTkLabel(
             self._scroll_frame,
             text="No DLCs available for download in the manifest.",
-            font=ctk.CTkFont(*theme.FONT_BODY),
-            text_color=theme.COLORS["text_muted"],
+            font=theme_font(theme.FONT_BODY),
+            text_color=_TEXT_MUTED,
         )
 
         # Row 3 — Overall progress
@@ -412,8 +594,8 @@ class DownloaderFrame(ctk.CTkFrame):
             prog_frame,
             height=6,
             corner_radius=3,
-            progress_color=theme.COLORS["accent"],
-            fg_color=theme.COLORS["bg_card_alt"],
+            progress_color=_ACCENT,
+            fg_color=_BG_CARD_ALT,
         )
         self._overall_progress.grid(row=0, column=0, sticky="ew")
         self._overall_progress.set(0)
@@ -421,8 +603,8 @@ class DownloaderFrame(ctk.CTkFrame):
         self._overall_label = ctk.CTkLabel(
             prog_frame,
             text="",
-            font=ctk.CTkFont(*theme.FONT_SMALL),
-            text_color=theme.COLORS["text_muted"],
+            font=theme_font(theme.FONT_SMALL),
+            text_color=_TEXT_MUTED,
         )
         self._overall_label.grid(row=1, column=0, sticky="w", pady=(2, 0))
 
@@ -446,8 +628,8 @@ class DownloaderFrame(ctk.CTkFrame):
         ctk.CTkLabel(
             header_row,
             text="Activity Log",
-            font=ctk.CTkFont(*theme.FONT_BODY_BOLD),
-            text_color=theme.COLORS["text"],
+            font=theme_font(theme.FONT_BODY_BOLD),
+            text_color=_TEXT,
         ).grid(row=0, column=0, sticky="w")
 
         ctk.CTkButton(
@@ -456,17 +638,17 @@ class DownloaderFrame(ctk.CTkFrame):
             width=50,
             height=theme.BUTTON_HEIGHT_SMALL - 4,
             corner_radius=theme.CORNER_RADIUS_SMALL,
-            fg_color=theme.COLORS["bg_card_alt"],
-            hover_color=theme.COLORS["card_hover"],
-            font=ctk.CTkFont(*theme.FONT_SMALL),
+            fg_color=_BG_CARD_ALT,
+            hover_color=_CARD_HOVER,
+            font=theme_font(theme.FONT_SMALL),
             command=self._clear_log,
         ).grid(row=0, column=1, sticky="e")
 
         self._log_box = ctk.CTkTextbox(
             log_section,
-            font=ctk.CTkFont(*theme.FONT_MONO),
-            fg_color=theme.COLORS["bg_deeper"],
-            text_color=theme.COLORS["text_muted"],
+            font=theme_font(theme.FONT_MONO),
+            fg_color=_BG_DEEPER,
+            text_color=_TEXT_MUTED,
             corner_radius=theme.CORNER_RADIUS_SMALL,
             state="disabled",
             wrap="word",
@@ -514,23 +696,81 @@ class DownloaderFrame(ctk.CTkFrame):
         # Fetch main manifest first (populates archived_versions)
         main_manifest = client.fetch_manifest()
 
+        # Scan installed DLC states on disk while the network-bound steps
+        # below run. Started only now because the first fetch_manifest()
+        # merges the remote catalog that get_dlc_states reads.
+        # The result list holds the states, or the exception the scan raised.
+        states_result: list = []
+        states_thread: threading.Thread | None = None
+        if game_dir:
+            states_thread = threading.Thread(
+                target=self._scan_states_bg,
+                args=(game_dir, states_result),
+                daemon=True,
+            )
+            states_thread.start()
+
         # Ensure CDN auth is initialized (idempotent)
         self.app.ensure_cdn_auth()
 
         # Use archived manifest if a specific version is selected
         if self._selected_version:
-            manifest = client.fetch_version_manifest(self._selected_version)
+            manifest = self._version_manifests.get(self._selected_version)
+            if manifest is None:
+                manifest = client.fetch_version_manifest(self._selected_version)
+                self._version_manifests[self._selected_version] = manifest
         else:
             manifest = main_manifest
 
         # Collect available versions for the dropdown
+        version_choices = self._version_choices(main_manifest)
+
+        dlc_downloads = manifest.dlc_downloads
+
+        # Detect cached (fully downloaded) archives. DLCDownloadEntry
+        # derives .filename from the URL at parse time, so no splitting here.
+        dlcs_dir = self.app.updater._download_dir / "dlcs"
+        existing_files = self._list_cached_files(dlcs_dir)
+        cached_ids = {
+            dlc_id for dlc_id, entry in dlc_downloads.items() if entry.filename in existing_files
+        }
+
+        # Get installed DLC IDs
+        installed_ids: set[str] = set()
+        if states_thread is not None:
+            states_thread.join()
+            states = states_result[0]
+            if isinstance(states, Exception):
+                raise states
+            for s in states:
+                if s.installed and s.complete:
+                    installed_ids.add(s.dlc.id)
+
+        return dlc_downloads, installed_ids, cached_ids, game_dir, version_choices
+
+    def _scan_states_bg(self, game_dir: str, result: list):
+        """Scan thread: append the DLC states (or the error) to *result*."""
+        try:
+            result.append(self.app.updater._dlc_manager.get_dlc_states(game_dir))
+        except Exception as e:
+            result.append(e)
+
+    def _version_choices(self, main_manifest: Manifest) -> list[str]:
+        """Dropdown labels for *main_manifest*'s archived versions, newest first.
+
+        The client memoizes the main manifest, so the labels are rebuilt
+        only when a new manifest object comes back.
+        """
+        cached = self._version_choices_cache
+        if cached is not None and cached[0] is main_manifest:
+            return cached[1]
         archived = main_manifest.archived_versions
-        version_choices = ["Latest"]
-        for ver_str in sorted(
-            archived,
-            key=lambda v: [int(x) for x in v.split(".")],
+        keyed = sorted(
+            ((tuple(map(int, v.split("."))), v) for v in archived),
             reverse=True,
-        ):
+        )
+        choices = ["Latest"]
+        for _, ver_str in keyed:
             av = archived[ver_str]
             parts = []
             if av.date:
@@ -538,37 +778,37 @@ class DownloaderFrame(ctk.CTkFrame):
             if av.dlc_count:
                 parts.append(f"{av.dlc_count} DLCs")
             label = f"{ver_str} ({', '.join(parts)})" if parts else ver_str
-            version_choices.append(label)
-
-        dlc_downloads = manifest.dlc_downloads
-
-        # Get installed DLC IDs
-        installed_ids: set[str] = set()
-        if game_dir:
-            states = self.app.updater._dlc_manager.get_dlc_states(game_dir)
-            for s in states:
-                if s.installed and s.complete:
-                    installed_ids.add(s.dlc.id)
+            choices.append(label)
+        self._version_choices_cache = (main_manifest, choices)
+        return choices
 
-        # Detect cached (fully downloaded) archives
-        cached_ids: set[str] = set()
-        dlcs_dir = self.app.updater._download_dir / "dlcs"
-        if dlcs_dir.is_dir():
-            existing_files = {
-                f.name for f in dlcs_dir.iterdir() if f.is_file() and f.suffix != ".partial"
+    def _list_cached_files(self, dlcs_dir: Path) -> set[str]:
+        """Return completed archive names in *dlcs_dir*, reusing the last
+        listing while the directory's mtime is unchanged."""
+        try:
+            mtime = dlcs_dir.stat().st_mtime_ns
+        except OSError:
+            self._dir_listing = None
+            return set()
+        key = (dlcs_dir, mtime)
+        cached = self._dir_listing
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        with os.scandir(dlcs_dir) as it:
+            names = {
+                e.name
+                for e in it
+                if e.is_file(follow_symlinks=False) and not e.name.endswith(".partial")
             }
-            for dlc_id, entry in dlc_downloads.items():
-                fname = entry.filename or entry.url.rsplit("/", 1)[-1].split("?")[0]
-                if fname in existing_files:
-                    cached_ids.add(dlc_id)
-
-        return dlc_downloads, installed_ids, cached_ids, game_dir, version_choices
+        self._dir_listing = (key, names)
+        return names
 
     def _on_scan_done(self, result):
         dlc_dl, inst, cached, gdir, ver_choices = result
         self._dlc_downloads = dlc_dl
         self._installed_ids = inst
-        self._cached_ids = cached
+        self._selectable_ids = dlc_dl.keys() - inst
+        self._cached_ids = frozenset(cached)
         self._game_dir = gdir
 
         # Update version dropdown options
@@ -587,7 +827,7 @@ class DownloaderFrame(ctk.CTkFrame):
 
     def _on_scan_error(self, error):
         self._hide_placeholders()
-        self._log(f"[{_timestamp()}] Error loading DLC list: {error}")
+        self._log(f"Error loading DLC list: {error}")
         self.app.show_toast(f"Failed to load DLC list: {error}", "error")
 
     def _hide_placeholders(self):
@@ -598,26 +838,39 @@ class DownloaderFrame(ctk.CTkFrame):
     # ── DLC List Building ─────────────────────────────────────────
 
     def _rebuild_rows(self):
-        """Destroy and recreate all DLC rows."""
-        for w in self._scroll_frame.winfo_children():
-            if w not in (
-                self._no_manifest_label,
-                self._loading_label,
-                self._empty_label,
-            ):
-                w.destroy()
-
-        self._dlc_vars.clear()
-        self._row_widgets.clear()
-
+        """Sync the DLC rows with the manifest, touching only changed rows."""
         catalog = self.app.updater._dlc_manager.catalog
 
+        # One catalog lookup per DLC, shared by grouping and the row builders
+        info_map = {dlc_id: catalog.get_by_id(dlc_id) for dlc_id in self._dlc_downloads}
+
         # Group DLCs by pack type
-        grouped: dict[str, list[tuple[str, DLCDownloadEntry]]] = {}
+        grouped: defaultdict[str, list[tuple[str, DLCDownloadEntry]]] = defaultdict(list)
+        installed_per_group: dict[str, int] = {}
         for dlc_id, entry in self._dlc_downloads.items():
-            info = catalog.get_by_id(dlc_id)
+            info = info_map[dlc_id]
             ptype = info.pack_type if info else "other"
-            grouped.setdefault(ptype, []).append((dlc_id, entry))
+            grouped[ptype].append((dlc_id, entry))
+            if dlc_id not in self._selectable_ids:
+                installed_per_group[ptype] = installed_per_group.get(ptype, 0) + 1
+
+        # Rows whose DLC left the manifest are unmapped and pooled for reuse
+        # by DLCs that appear later (e.g. switching versions back and forth).
+        for dlc_id in [d for d in self._row_widgets if d not in self._dlc_downloads]:
+            rw = self._row_widgets.pop(dlc_id)
+            rw.row_frame.grid_remove()
+            self._row_pool.append(rw)
+            self._dlc_vars.pop(dlc_id, None)
+
+        # Section headers are only unmapped here; destroying them waits for
+        # idle time so the updated list appears first.
+        stale: list = []
+        for ptype in [p for p in self._section_headers if p not in grouped]:
+            stale.append(self._section_headers.pop(ptype))
+        if stale:
+            for w in stale:
+                w.grid_remove()
+            self.after_idle(self._destroy_widgets, stale)
 
         grid_row = 0
         for ptype in _TYPE_ORDER:
@@ -627,39 +880,93 @@ class DownloaderFrame(ctk.CTkFrame):
 
             # Section header
             label_text = _TYPE_LABELS.get(ptype, ptype.upper())
-            count_installed = sum(1 for did, _ in items if did in self._installed_ids)
-            header = ctk.CTkLabel(
-                self._scroll_frame,
-                text=f"  {label_text}  ({count_installed}/{len(items)} installed)",
-                font=ctk.CTkFont(*theme.FONT_BODY_BOLD),
-                text_color=theme.COLORS["text_muted"],
-            )
+            count_installed = installed_per_group.get(ptype, 0)
+            header_text = f"  {label_text}  ({count_installed}/{len(items)} installed)"
+            header = self._section_headers.get(ptype)
+            if header is None:
+                header = ctk.CTkLabel(
+                    self._scroll_frame,
+                    text=header_text,
+                    font=theme_font(theme.FONT_BODY_BOLD),
+                    text_color=_TEXT_MUTED,
+                )
+                self._section_headers[ptype] = header
+            elif header.cget("text") != header_text:
+                header.configure(text=header_text)
             header.grid(row=grid_row, column=0, sticky="w", pady=(10, 4), padx=4)
             grid_row += 1
 
-            for idx, (dlc_id, entry) in enumerate(sorted(items, key=lambda x: x[0])):
-                self._build_dlc_row(dlc_id, entry, grid_row, idx)
+            items.sort(key=itemgetter(0))
+            for idx, (dlc_id, entry) in enumerate(items):
+                rw = self._row_widgets.get(dlc_id)
+                if rw is None and self._row_pool:
+                    self._reuse_dlc_row(dlc_id, entry, info_map[dlc_id], grid_row, idx)
+                elif rw is None:
+                    self._build_dlc_row(dlc_id, entry, info_map[dlc_id], grid_row, idx)
+                else:
+                    if rw.signature != self._row_signature(dlc_id, entry, idx):
+                        self._refresh_dlc_row(dlc_id, entry, info_map[dlc_id], idx)
+                    if rw.grid_row != grid_row:
+                        rw.row_frame.grid(row=grid_row)
+                        rw.grid_row = grid_row
                 grid_row += 1
 
         # Update overall label with missing/installed/total counts
         self._update_summary_label()
 
-    def _build_dlc_row(self, dlc_id: str, entry: DLCDownloadEntry, grid_row: int, idx: int):
-        catalog = self.app.updater._dlc_manager.catalog
-        info = catalog.get_by_id(dlc_id)
+    @staticmethod
+    def _destroy_widgets(widgets: list):
+        for w in widgets:
+            w.destroy()
+
+    def _row_signature(self, dlc_id: str, entry: DLCDownloadEntry, idx: int) -> tuple:
+        """Everything a row's static appearance depends on."""
+        return (
+            entry.size,
+            bool(entry.url),
+            dlc_id in self._installed_ids,
+            dlc_id in self._cached_ids,
+            idx % 2,
+        )
+
+    @staticmethod
+    def _row_checkbox_style(dlc_id: str, info, is_installed: bool) -> tuple[str, str]:
+        """Return (text, text_color) for a row's checkbox."""
         name = info.name_en if info else dlc_id
+        if is_installed:
+            return f"\u2713  {dlc_id} \u2014 {name}", _SUCCESS
+        return f"{dlc_id} \u2014 {name}", _TEXT
 
+    @staticmethod
+    def _row_badge(entry: DLCDownloadEntry, is_installed: bool, is_cached: bool):
+        """Return (text, style) for a row's status badge."""
+        if is_installed:
+            return "Installed", "success"
+        if is_cached:
+            return "Cached", "info"
+        if entry.url and entry.size > 0:
+            return "On CDN", "info"
+        return "Not Available", "muted"
+
+    def _build_dlc_row(
+        self,
+        dlc_id: str,
+        entry: DLCDownloadEntry,
+        info,
+        grid_row: int,
+        idx: int,
+    ):
         is_installed = dlc_id in self._installed_ids
         is_cached = dlc_id in self._cached_ids
 
-        bg = theme.COLORS["bg_card"] if idx % 2 == 0 else theme.COLORS["bg_card_alt"]
+        bg = _BG_CARD if idx % 2 == 0 else _BG_CARD_ALT
 
         row_frame = ctk.CTkFrame(
             self._scroll_frame,
             fg_color=bg,
             corner_radius=theme.CORNER_RADIUS_SMALL,
             border_width=1,
-            border_color=theme.COLORS["border"],
+            border_color=_BORDER,
             height=42,
         )
         row_frame.grid(row=grid_row, column=0, sticky="ew", padx=2, pady=1)
@@ -667,40 +974,26 @@ class DownloaderFrame(ctk.CTkFrame):
 
         # Checkbox
         var = ctk.BooleanVar(value=is_installed or is_cached)
-        if is_installed:
-            cb_text = f"\u2713  {dlc_id} \u2014 {name}"
-            cb_color = theme.COLORS["success"]
-        else:
-            cb_text = f"{dlc_id} \u2014 {name}"
-            cb_color = theme.COLORS["text"]
+        cb_text, cb_color = self._row_checkbox_style(dlc_id, info, is_installed)
         cb = ctk.CTkCheckBox(
             row_frame,
             text=cb_text,
             variable=var,
-            font=ctk.CTkFont(*theme.FONT_BODY),
+            font=theme_font(theme.FONT_BODY),
             text_color=cb_color,
-            fg_color=theme.COLORS["accent"],
-            hover_color=theme.COLORS["accent_hover"],
-            border_color=theme.COLORS["text_muted"],
-            checkmark_color=theme.COLORS["text"],
+            fg_color=_ACCENT,
+            hover_color=_ACCENT_HOVER,
+            border_color=_TEXT_MUTED,
+            checkmark_color=_TEXT,
+            state="disabled" if is_installed else "normal",
         )
         cb.grid(row=0, column=0, padx=(12, 4), pady=6, sticky="w")
 
-        if is_installed:
-            cb.configure(state="disabled")
-            var.set(True)
-
         self._dlc_vars[dlc_id] = var
 
         # Status badge
-        if is_installed:
-            badge = StatusBadge(row_frame, text="Installed", style="success")
-        elif is_cached:
-            badge = StatusBadge(row_frame, text="Cached", style="info")
-        elif entry.url and entry.size > 0:
-            badge = StatusBadge(row_frame, text="On CDN", style="info")
-        else:
-            badge = StatusBadge(row_frame, text="Not Available", style="muted")
+        badge_text, badge_style = self._row_badge(entry, is_installed, is_cached)
+        badge = StatusBadge(row_frame, text=badge_text, style=badge_style)
         badge.grid(row=0, column=2, padx=4, pady=6)
 
         # Size label
@@ -708,8 +1001,8 @@ class DownloaderFrame(ctk.CTkFrame):
         size_lbl = ctk.CTkLabel(
             row_frame,
             text=size_text,
-            font=ctk.CTkFont(*theme.FONT_SMALL),
-            text_color=theme.COLORS["text_dim"],
+            font=theme_font(theme.FONT_SMALL),
+            text_color=_TEXT_DIM,
             width=60,
         )
         size_lbl.grid(row=0, column=3, padx=(4, 8), pady=6, sticky="e")
@@ -720,8 +1013,8 @@ class DownloaderFrame(ctk.CTkFrame):
             height=4,
             corner_radius=2,
             width=120,
-            progress_color=theme.COLORS["accent"],
-            fg_color=theme.COLORS["bg_deeper"],
+            progress_color=_ACCENT,
+            fg_color=_BG_DEEPER,
         )
         prog.set(0)
         prog.grid(row=0, column=4, padx=4, pady=6)
@@ -731,39 +1024,87 @@ class DownloaderFrame(ctk.CTkFrame):
         state_lbl = ctk.CTkLabel(
             row_frame,
             text="",
-            font=ctk.CTkFont(*theme.FONT_SMALL),
-            text_color=theme.COLORS["text_muted"],
+            font=theme_font(theme.FONT_SMALL),
+            text_color=_TEXT_MUTED,
             width=130,
         )
         state_lbl.grid(row=0, column=5, padx=(0, 12), pady=6, sticky="e")
         state_lbl.grid_remove()
 
-        self._row_widgets[dlc_id] = {
-            "row_frame": row_frame,
-            "checkbox": cb,
-            "badge": badge,
-            "progress_bar": prog,
-            "state_label": state_lbl,
-            "speed_tracker": _SpeedTracker(),
-        }
+        self._row_widgets[dlc_id] = _RowWidgets(
+            row_frame=row_frame,
+            checkbox=cb,
+            badge=badge,
+            size_label=size_lbl,
+            progress_bar=prog,
+            state_label=state_lbl,
+            speed_tracker=_SpeedTracker(),
+            grid_row=grid_row,
+            signature=self._row_signature(dlc_id, entry, idx),
+        )
+
+    def _reuse_dlc_row(
+        self,
+        dlc_id: str,
+        entry: DLCDownloadEntry,
+        info,
+        grid_row: int,
+        idx: int,
+    ):
+        """Give a pooled row to *dlc_id* instead of building a new one."""
+        rw = self._row_pool.pop()
+        var = ctk.BooleanVar()
+        rw.checkbox.configure(variable=var)
+        self._dlc_vars[dlc_id] = var
+        self._row_widgets[dlc_id] = rw
+        rw.speed_tracker.reset()
+        rw.row_frame.grid(row=grid_row)
+        rw.grid_row = grid_row
+        self._refresh_dlc_row(dlc_id, entry, info, idx)
+
+    def _refresh_dlc_row(self, dlc_id: str, entry: DLCDownloadEntry, info, idx: int):
+        """Bring an existing row up to date in place (same result as a rebuild)."""
+        rw = self._row_widgets[dlc_id]
+        is_installed = dlc_id in self._installed_ids
+        is_cached = dlc_id in self._cached_ids
+
+        bg = _BG_CARD if idx % 2 == 0 else _BG_CARD_ALT
+        rw.row_frame.configure(fg_color=bg)
+
+        cb_text, cb_color = self._row_checkbox_style(dlc_id, info, is_installed)
+        rw.checkbox.configure(
+            text=cb_text,
+            text_color=cb_color,
+            state="disabled" if is_installed else "normal",
+        )
+        self._dlc_vars[dlc_id].set(is_installed or is_cached)
+
+        rw.badge.set_status(*self._row_badge(entry, is_installed, is_cached))
+        rw.size_label.configure(text=_format_size(entry.size) if entry.size > 0 else "")
+
+        # Clear leftovers from a previous download session
+        _set_row_progress(rw, 0.0)
+        rw.progress_bar.grid_remove()
+        rw.state_label.configure(text="")
+        rw.state_label.grid_remove()
+
+        rw.signature = self._row_signature(dlc_id, entry, idx)
 
     # ── Selection ─────────────────────────────────────────────────
 
     def _select_missing(self):
         """Auto-select only DLCs that are not installed and not cached."""
-        for dlc_id, var in self._dlc_vars.items():
-            if dlc_id not in self._installed_ids and dlc_id not in self._cached_ids:
-                var.set(True)
+        for dlc_id in self._selectable_ids - self._cached_ids:
+            self._dlc_vars[dlc_id].set(True)
 
     def _deselect_all(self):
-        for dlc_id, var in self._dlc_vars.items():
-            if dlc_id not in self._installed_ids:
-                var.set(False)
+        for dlc_id in self._selectable_ids:
+            self._dlc_vars[dlc_id].set(False)
 
     def _update_summary_label(self):
         """Update the bottom label with missing/installed/total counts."""
         total = len(self._dlc_downloads)
-        installed = len(self._installed_ids & set(self._dlc_downloads))
+        installed = total - len(self._selectable_ids)
         missing = total - installed
         self._overall_label.configure(
             text=f"{missing} missing \u00b7 {installed} installed \u00b7 {total} total"
@@ -778,7 +1119,7 @@ class DownloaderFrame(ctk.CTkFrame):
         selected = [
             dlc_id
             for dlc_id, var in self._dlc_vars.items()
-            if var.get() and dlc_id not in self._installed_ids
+            if dlc_id in self._selectable_ids and var.get()
         ]
         if not selected:
             self.app.show_toast("No DLCs selected for download", "warning")
@@ -822,17 +1163,30 @@ class DownloaderFrame(ctk.CTkFrame):
         self._completed_count = 0
         self._failed_count = 0
         self._extracted_count = 0
+        self._done_count = 0  # completed + failed + extracted
         self._total_to_download = len(entries)
-        self._last_progress_time.clear()
+        self._last_progress.clear()
+        self._active_progress_ids = {e.dlc_id for e in entries}
         self._overall_progress.set(0)
+        self._last_overall_progress = 0.0
         self._download_entries = entries
+        catalog = self.app.updater._dlc_manager.catalog
+        self._dlc_info = {e.dlc_id: catalog.get_by_id(e.dlc_id) for e in entries}
+        self._dlc_start_msg = {}
+        for e in entries:
+            info = self._dlc_info[e.dlc_id]
+            name = info.name_en if info else e.dlc_id
+            size_part = f" ({_format_size(e.size)})" if e.size > 0 else ""
+            self._dlc_start_msg[e.dlc_id] = f"Downloading {e.dlc_id} \u2014 {name}{size_part}..."
         self._download_start_time = time.monotonic()
         self._dlc_bytes.clear()
+        self._dlc_bytes_total = 0
         self._dlc_start_times.clear()
         self._logged_dl_start.clear()
 
         # Reset speed trackers
         total_download_size = sum(e.size for e in entries)
+        self._total_download_size = total_download_size
         self._overall_tracker.reset(total_size=total_download_size)
 
         self.app.telemetry.track_event(
@@ -850,202 +1204,187 @@ class DownloaderFrame(ctk.CTkFrame):
         for entry in entries:
             rw = self._row_widgets.get(entry.dlc_id)
             if rw:
-                rw["progress_bar"].set(0)
-                rw["progress_bar"].grid()
-                rw["state_label"].configure(text="Waiting...")
-                rw["state_label"].grid()
-                rw["badge"].set_status("Pending", "muted")
-                rw["speed_tracker"].reset(total_size=entry.size)
-
-        # Build settings description for log
-        try:
-            workers = int(self._concurrency_var.get())
-        except ValueError:
-            workers = 3
-        try:
-            speed_mb = int(self._speed_var.get() or "0")
-        except ValueError:
-            speed_mb = 0
-        speed_desc = f"{speed_mb} MB/s" if speed_mb > 0 else "unlimited"
-        self._log(
-            f"[{_timestamp()}] Starting download of {len(entries)} DLC(s) "
-            f"({workers} workers, {speed_desc})"
-        )
-
-        # Save settings
+                _set_row_progress(rw, 0.0)
+                rw.progress_bar.grid()
+                rw.state_label.configure(text="Waiting...")
+                rw.state_label.grid()
+                rw.badge.set_status("Pending", "muted")
+                rw.speed_tracker.reset(total_size=entry.size)
+                rw.signature = ()  # force a refresh on the next rebuild
+
+        # Parse the settings widgets once; invalid input keeps the saved value
+        settings = self.app.settings
         with contextlib.suppress(ValueError):
-            self.app.settings.download_concurrency = int(self._concurrency_var.get())
+            settings.download_concurrency = int(self._concurrency_var.get())
         with contextlib.suppress(ValueError):
-            self.app.settings.download_speed_limit = int(self._speed_var.get() or "0")
-        self.app.settings.save()
+            settings.download_speed_limit = int(self._speed_var.get() or "0")
+        settings.save()
+        workers = settings.download_concurrency or 3
+        speed_mb = settings.download_speed_limit or 0
+
+        speed_desc = f"{speed_mb} MB/s" if speed_mb > 0 else "unlimited"
+        self._log(f"Starting download of {len(entries)} DLC(s) ({workers} workers, {speed_desc})")
 
         self._download_thread = threading.Thread(
             target=self._download_bg,
-            args=(entries,),
+            args=(entries, workers, speed_mb * 1_048_576),
             daemon=True,
         )
         self._download_thread.start()
+        self._progress_after_id = self.after(_PROGRESS_POLL_MS, self._drain_progress)
 
-    def _download_bg(self, entries: list[DLCDownloadEntry]):
-        """Background thread: run parallel downloads."""
-        # Read settings saved on the GUI thread in _start_downloads (lines 839-858)
-        # instead of accessing tkinter StringVars from this background thread.
-        max_workers = self.app.settings.download_concurrency or 3
-        speed_mb = self.app.settings.download_speed_limit or 0
-        speed_bytes = speed_mb * 1_048_576
-
-        auth = self.app._cdn_auth.get_auth_adapter() if self.app._cdn_auth else None
-        downloader = self.app.updater.create_parallel_dlc_downloader(
-            game_dir=self._game_dir,
-            max_workers=max_workers,
-            speed_limit_bytes=speed_bytes,
-            auth=auth,
-        )
-        with self._dl_lock:
-            self._active_downloader = downloader
+    def _download_bg(
+        self,
+        entries: list[DLCDownloadEntry],
+        max_workers: int,
+        speed_bytes: int,
+    ):
+        """Background thread: run parallel downloads.
 
-        def progress_cb(dlc_id, state, downloaded, total, message):
-            # Throttle per-DLC progress updates to avoid GUI flooding
-            now = time.monotonic()
-            last = self._last_progress_time.get(dlc_id, 0)
-            is_state_change = state not in (DLCDownloadState.DOWNLOADING,)
-            if is_state_change or (now - last) >= 0.15:
-                self._last_progress_time[dlc_id] = now
-                self.app._enqueue_gui(
-                    self._update_dlc_progress,
-                    dlc_id,
-                    state,
-                    downloaded,
-                    total,
-                    message,
-                )
+        *max_workers* and *speed_bytes* are parsed on the GUI thread in
+        _start_downloads so this thread never touches tkinter variables.
+        """
 
+        def progress_cb(dlc_id, state, downloaded, total, message):
+            # Finished DLCs get no further row updates
+            if dlc_id not in self._active_progress_ids:
+                return
+            if state == DLCDownloadState.DOWNLOADING:
+                # Throttle per-DLC progress updates to avoid GUI flooding:
+                # forward at most every _PROGRESS_INTERVAL_MS, and only once
+                # ~0.5% of the file (min 64 KB) has arrived unless
+                # _PROGRESS_MAX_INTERVAL_MS has passed. Repeated byte counts
+                # carry nothing new and are always dropped.
+                now_ms = time.monotonic_ns() // 1_000_000
+                last = self._last_progress.get(dlc_id)
+                if last is not None:
+                    elapsed = now_ms - last[0]
+                    delta = downloaded - last[1]
+                    if (
+                        elapsed < _PROGRESS_INTERVAL_MS
+                        or delta == 0
+                        or (
+                            delta < max(total // 200, _PROGRESS_MIN_BYTES)
+                            and elapsed < _PROGRESS_MAX_INTERVAL_MS
+                        )
+                    ):
+                        return
+                self._last_progress[dlc_id] = (now_ms, downloaded)
+            self._progress_q.put((dlc_id, state, downloaded, total, message))
+            if state in _FINAL_STATES:
+                self._active_progress_ids.discard(dlc_id)
+
+        # Setup failures must reach _on_downloads_error too, or the tab
+        # would stay busy with its buttons locked
+        downloader: ParallelDLCDownloader | None = None
         try:
+            auth = self.app._cdn_auth.get_auth_adapter() if self.app._cdn_auth else None
+            downloader = self.app.updater.create_parallel_dlc_downloader(
+                game_dir=self._game_dir,
+                max_workers=max_workers,
+                speed_limit_bytes=speed_bytes,
+                auth=auth,
+            )
+            with self._dl_lock:
+                self._active_downloader = downloader
+
             results = downloader.download_parallel(entries, progress=progress_cb)
-            self.app._enqueue_gui(self._on_downloads_done, results)
+            stats = _DownloadSummary.from_results(results, self._download_start_time)
+            self.app._enqueue_gui(self._on_downloads_done, results, stats)
         except Exception as e:
             from ...core.exceptions import AccessRequiredError, BannedError
 
             if isinstance(e, (BannedError, AccessRequiredError)):
-                self.app._enqueue_gui(self.app._show_error, e)
+                self.app._enqueue_gui(self._on_downloads_blocked, e)
             else:
                 self.app._enqueue_gui(self._on_downloads_error, e)
         finally:
             with self._dl_lock:
                 self._active_downloader = None
-            downloader.close()
+            if downloader is not None:
+                downloader.close()
+
+    def _drain_progress(self, reschedule: bool = True):
+        """GUI thread: apply queued progress events in one pass.
+
+        Byte updates are coalesced to the latest per DLC; a state change
+        first applies that DLC's pending byte update so events stay in order.
+        """
+        self._progress_after_id = None
+        pending: dict[str, tuple[int, int, str]] = {}
+        changed = False
+        while True:
+            try:
+                dlc_id, state, downloaded, total, message = self._progress_q.get_nowait()
+            except queue.Empty:
+                break
+            if state == DLCDownloadState.DOWNLOADING:
+                pending[dlc_id] = (downloaded, total, message)
+                continue
+            latest = pending.pop(dlc_id, None)
+            if latest is not None:
+                self._update_dlc_progress(dlc_id, DLCDownloadState.DOWNLOADING, *latest)
+            self._update_dlc_progress(dlc_id, state, downloaded, total, message)
+            changed = True
+        for dlc_id, latest in pending.items():
+            self._update_dlc_progress(dlc_id, DLCDownloadState.DOWNLOADING, *latest)
+        if pending:
+            # One overall sample per drain, not one per DLC
+            self._overall_tracker.update(self._dlc_bytes_total)
+        if changed or pending:
+            # Byte-only drains refresh the label's speed/ETA at most once a second
+            self._refresh_overall_progress(force_label=changed)
+        if reschedule and self._busy:
+            self._progress_after_id = self.after(_PROGRESS_POLL_MS, self._drain_progress)
+
+    def _stop_progress_drain(self):
+        """Cancel the poll loop and apply whatever is still queued."""
+        if self._progress_after_id is not None:
+            self.after_cancel(self._progress_after_id)
+        self._drain_progress(reschedule=False)
 
     def _update_dlc_progress(self, dlc_id, state, downloaded, total, message):
         """GUI thread: update a single DLC row's progress."""
         rw = self._row_widgets.get(dlc_id)
         if not rw:
             return
+        handler = self._state_handlers.get(state)
+        if handler:  # PENDING is handled at start
+            handler(rw, dlc_id, downloaded, total, message)
+
+    def _on_dlc_downloading(self, rw: _RowWidgets, dlc_id, downloaded, total, message):
+        if total > 0:
+            _set_row_progress(rw, downloaded / total)
+
+        # Track per-DLC speed
+        tracker = rw.speed_tracker
+        tracker.update(downloaded)
+        self._set_dlc_bytes(dlc_id, downloaded)
+
+        speed = tracker.speed_bps
+        if speed > 0:
+            eta = tracker.eta_seconds
+            eta_text = _format_eta(eta)
+            speed_text = _format_speed(speed)
+            text = f"{speed_text}  {eta_text}"
+        else:
+            dl_text = _format_size(downloaded)
+            tot_text = _format_size(total) if total > 0 else "?"
+            text = f"{dl_text}/{tot_text}"
+        state_lbl = rw.state_label
+        if state_lbl.cget("text") != text:
+            state_lbl.configure(text=text)
 
-        prog_bar = rw["progress_bar"]
-        state_lbl = rw["state_label"]
-        badge = rw["badge"]
-        tracker = rw["speed_tracker"]
-
-        if state == DLCDownloadState.DOWNLOADING:
-            if total > 0:
-                prog_bar.set(downloaded / total)
-
-            # Track per-DLC speed
-            tracker.update(downloaded)
-            self._dlc_bytes[dlc_id] = downloaded
-
-            speed = tracker.speed_bps
-            if speed > 0:
-                eta = tracker.eta_seconds
-                eta_text = _format_eta(eta)
-                speed_text = _format_speed(speed)
-                state_lbl.configure(text=f"{speed_text}  {eta_text}")
-            else:
-                dl_text = _format_size(downloaded)
-                tot_text = _format_size(total) if total > 0 else "?"
-                state_lbl.configure(text=f"{dl_text}/{tot_text}")
-
-            badge.set_status("Downloading", "info")
-
-            # Update overall speed tracker with sum of all DLC bytes
-            total_cumulative = sum(self._dlc_bytes.values())
-            self._overall_tracker.update(total_cumulative)
-
-        elif state == DLCDownloadState.EXTRACTING:
-            prog_bar.set(1.0)
-            state_lbl.configure(text="Extracting...")
-            badge.set_status("Extracting", "warning")
-            self._log(f"[{_timestamp()}] Extracting {dlc_id}...")
-
-        elif state == DLCDownloadState.REGISTERING:
-            state_lbl.configure(text="Registering...")
-            badge.set_status("Registering", "warning")
-            self._log(f"[{_timestamp()}] Registering {dlc_id} in crack config...")
-
-        elif state == DLCDownloadState.COMPLETED:
-            prog_bar.set(1.0)
-            badge.set_status("Installed", "success")
-            cb = rw["checkbox"]
-            cb.configure(state="disabled")
-            # Update to green checkmark style
-            catalog = self.app.updater._dlc_manager.catalog
-            cinfo = catalog.get_by_id(dlc_id)
-            cname = cinfo.name_en if cinfo else dlc_id
-            cb.configure(
-                text=f"\u2713  {dlc_id} \u2014 {cname}",
-                text_color=theme.COLORS["success"],
-            )
-            self._completed_count += 1
-            self._installed_ids.add(dlc_id)
-            # Record full size for overall progress bar
-            entry = self._dlc_downloads.get(dlc_id)
-            if entry and entry.size > 0:
-                self._dlc_bytes[dlc_id] = entry.size
-            # Log with timing
-            elapsed = self._dlc_elapsed(dlc_id)
-            avg_speed = self._dlc_avg_speed(dlc_id)
-            state_lbl.configure(text="Done")
-            self._log(f"[{_timestamp()}] Completed {dlc_id} in {elapsed} ({avg_speed})")
-
-        elif state == DLCDownloadState.EXTRACTED:
-            prog_bar.set(1.0)
-            state_lbl.configure(text="Needs Config")
-            badge.set_status("Extracted", "warning")
-            self._extracted_count += 1
-            entry = self._dlc_downloads.get(dlc_id)
-            if entry and entry.size > 0:
-                self._dlc_bytes[dlc_id] = entry.size
-            elapsed = self._dlc_elapsed(dlc_id)
-            self._log(
-                f"[{_timestamp()}] WARNING: {dlc_id} extracted but registration "
-                f"failed ({elapsed}) \u2014 enable in DLC tab"
-            )
-
-        elif state == DLCDownloadState.FAILED:
-            state_lbl.configure(text="Failed")
-            badge.set_status("Failed", "error")
-            self._failed_count += 1
-            self._log(f"[{_timestamp()}] FAILED: {dlc_id} \u2014 {message}")
-
-        elif state == DLCDownloadState.CANCELLED:
-            state_lbl.configure(text="Cancelled")
-            badge.set_status("Cancelled", "muted")
-            self._log(f"[{_timestamp()}] Cancelled: {dlc_id}")
-
-        elif state == DLCDownloadState.PENDING:
-            pass  # handled at start
+        rw.badge.set_status("Downloading", "info")
 
         # Log download start once per DLC (guard against duplicate callbacks)
-        if state == DLCDownloadState.DOWNLOADING and dlc_id not in self._logged_dl_start:
+        if dlc_id not in self._logged_dl_start:
             self._logged_dl_start.add(dlc_id)
             self._dlc_start_times[dlc_id] = time.monotonic()
-            catalog = self.app.updater._dlc_manager.catalog
-            info = catalog.get_by_id(dlc_id)
-            name = info.name_en if info else dlc_id
+            msg = self._dlc_start_msg.get(dlc_id, f"Downloading {dlc_id}...")
+            self._log(msg)
+            info = self._dlc_info.get(dlc_id)
             entry = self._dlc_downloads.get(dlc_id)
-            size_str = _format_size(entry.size) if entry and entry.size > 0 else ""
-            size_part = f" ({size_str})" if size_str else ""
-            self._log(f"[{_timestamp()}] Downloading {dlc_id} \u2014 {name}{size_part}...")
             self.app.telemetry.track_event(
                 "dlc_item_started",
                 {
@@ -1055,15 +1394,98 @@ class DownloaderFrame(ctk.CTkFrame):
                 },
             )
 
+    def _on_dlc_extracting(self, rw: _RowWidgets, dlc_id, downloaded, total, message):
+        _set_row_progress(rw, 1.0)
+        rw.state_label.configure(text="Extracting...")
+        rw.badge.set_status("Extracting", "warning")
+        self._log(f"Extracting {dlc_id}...")
+
+    def _on_dlc_registering(self, rw: _RowWidgets, dlc_id, downloaded, total, message):
+        rw.state_label.configure(text="Registering...")
+        rw.badge.set_status("Registering", "warning")
+        self._log(f"Registering {dlc_id} in crack config...")
+
+    def _on_dlc_completed(self, rw: _RowWidgets, dlc_id, downloaded, total, message):
+        _set_row_progress(rw, 1.0)
+        rw.badge.set_status("Installed", "success")
+        cb = rw.checkbox
+        cb.configure(state="disabled")
+        # Update to green checkmark style
+        cinfo = self._dlc_info.get(dlc_id)
+        cname = cinfo.name_en if cinfo else dlc_id
+        cb.configure(
+            text=f"\u2713  {dlc_id} \u2014 {cname}",
+            text_color=_SUCCESS,
+        )
+        self._completed_count += 1
+        self._done_count += 1
+        self._installed_ids.add(dlc_id)
+        self._selectable_ids.discard(dlc_id)
+        # Record full size for overall progress bar
+        entry = self._dlc_downloads.get(dlc_id)
+        if entry and entry.size > 0:
+            self._set_dlc_bytes(dlc_id, entry.size)
+        # Log with timing
+        elapsed = self._dlc_elapsed(dlc_id)
+        avg_speed = self._dlc_avg_speed(dlc_id)
+        rw.state_label.configure(text="Done")
+        self._log(f"Completed {dlc_id} in {elapsed} ({avg_speed})")
+
+    def _on_dlc_extracted(self, rw: _RowWidgets, dlc_id, downloaded, total, message):
+        _set_row_progress(rw, 1.0)
+        rw.state_label.configure(text="Needs Config")
+        rw.badge.set_status("Extracted", "warning")
+        self._extracted_count += 1
+        self._done_count += 1
+        entry = self._dlc_downloads.get(dlc_id)
+        if entry and entry.size > 0:
+            self._set_dlc_bytes(dlc_id, entry.size)
+        elapsed = self._dlc_elapsed(dlc_id)
+        self._log(
+            f"WARNING: {dlc_id} extracted but registration "
+            f"failed ({elapsed}) \u2014 enable in DLC tab"
+        )
+
+    def _on_dlc_failed(self, rw: _RowWidgets, dlc_id, downloaded, total, message):
+        rw.state_label.configure(text="Failed")
+        rw.badge.set_status("Failed", "error")
+        self._failed_count += 1
+        self._done_count += 1
+        self._log(f"FAILED: {dlc_id} \u2014 {message}")
+
+    def _on_dlc_cancelled(self, rw: _RowWidgets, dlc_id, downloaded, total, message):
+        rw.state_label.configure(text="Cancelled")
+        rw.badge.set_status("Cancelled", "muted")
+        self._log(f"Cancelled: {dlc_id}")
+
+    def _set_dlc_bytes(self, dlc_id: str, value: int):
+        """Record a DLC's byte count, keeping the running total in step."""
+        self._dlc_bytes_total += value - self._dlc_bytes.get(dlc_id, 0)
+        self._dlc_bytes[dlc_id] = value
+
+    def _refresh_overall_progress(self, force_label: bool = True):
+        """GUI thread: update the overall progress bar and summary label.
+
+        Unless *force_label* is set, the label is rewritten at most every
+        _OVERALL_LABEL_MS.
+        """
         # Update overall progress bar using byte-level progress
-        total_size = sum(e.size for e in self._download_entries) if self._download_entries else 0
+        total_size = self._total_download_size
         if total_size > 0:
-            self._overall_progress.set(min(1.0, sum(self._dlc_bytes.values()) / total_size))
+            # Quantized to 0.1% so sub-pixel changes skip the Tcl round-trip
+            value = round(min(1.0, self._dlc_bytes_total / total_size) * 1000) / 1000
+            if value != self._last_overall_progress:
+                self._last_overall_progress = value
+                self._overall_progress.set(value)
+
+        now_ms = time.monotonic_ns() // 1_000_000
+        if not force_label and now_ms - self._overall_label_ms < _OVERALL_LABEL_MS:
+            return
+        self._overall_label_ms = now_ms
 
-        done = self._completed_count + self._failed_count + self._extracted_count
         overall_speed = self._overall_tracker.speed_bps
         overall_eta = self._overall_tracker.eta_seconds
-        parts = [f"{done}/{self._total_to_download} processed"]
+        parts = [f"{self._done_count}/{self._total_to_download} processed"]
         if overall_speed > 0:
             parts.append(_format_speed(overall_speed))
         if overall_eta is not None and overall_eta > 0:
@@ -1092,55 +1514,36 @@ class DownloaderFrame(ctk.CTkFrame):
             return ""
         return f"{_format_speed(entry.size / elapsed)} avg"
 
-    def _on_downloads_done(self, results: list[DLCDownloadTask]):
+    def _finish_downloads(self):
+        """GUI thread: end a batch however it stopped — done, failed or blocked."""
+        self._stop_progress_drain()
         self._busy = False
         self._pause_btn.grid_remove()
         self._resume_btn.grid_remove()
         self._cancel_btn.grid_remove()
         self._set_buttons_state("normal")
-        self._overall_progress.set(1.0)
         self._active_downloader = None
         # Clear the updater cancel flag so subsequent operations aren't affected
         self.app.updater.reset_cancel()
 
-        completed = sum(1 for r in results if r.state == DLCDownloadState.COMPLETED)
-        extracted = sum(1 for r in results if r.state == DLCDownloadState.EXTRACTED)
-        failed = sum(1 for r in results if r.state == DLCDownloadState.FAILED)
-        cancelled = sum(1 for r in results if r.state == DLCDownloadState.CANCELLED)
+    def _on_downloads_done(self, results: list[DLCDownloadTask], stats: _DownloadSummary):
+        self._finish_downloads()
+        self._overall_progress.set(1.0)
 
-        parts = []
-        if completed:
-            parts.append(f"{completed} installed")
-        if extracted:
-            parts.append(f"{extracted} extracted")
-        if failed:
-            parts.append(f"{failed} failed")
-        if cancelled:
-            parts.append(f"{cancelled} cancelled")
-        summary = ", ".join(parts) or "No DLCs processed"
-
-        # Calculate total duration and average speed
-        duration = time.monotonic() - self._download_start_time
-        total_bytes = sum(
-            e.size
-            for e in self._download_entries
-            if e.dlc_id in self._installed_ids
-            or e.dlc_id
-            in {r.entry.dlc_id for r in results if r.state == DLCDownloadState.EXTRACTED}
-        )
+        summary = stats.text
+        duration = stats.duration
+        total_bytes = stats.total_bytes
         duration_str = _format_eta(duration).replace("ETA ", "") or f"{duration:.0f}s"
         avg_speed = _format_speed(total_bytes / duration) if duration > 0 else ""
 
-        self._log(f"[{_timestamp()}] Finished: {summary} (total {duration_str})")
+        self._log(f"Finished: {summary} (total {duration_str})")
         if avg_speed:
-            self._log(f"[{_timestamp()}] Average speed: {avg_speed}")
+            self._log(f"Average speed: {avg_speed}")
 
         # Per-DLC telemetry events
-        catalog = self.app.updater._dlc_manager.catalog
-        total_retries = 0
         for r in results:
             dlc_id = r.entry.dlc_id
-            cinfo = catalog.get_by_id(dlc_id)
+            cinfo = self._dlc_info.get(dlc_id)
             pack_type = cinfo.pack_type if cinfo else None
             if r.state in (DLCDownloadState.COMPLETED, DLCDownloadState.EXTRACTED):
                 dlc_dur = duration
@@ -1149,7 +1552,6 @@ class DownloaderFrame(ctk.CTkFrame):
                     dlc_dur = time.monotonic() - start
                 dlc_size = self._dlc_bytes.get(dlc_id, r.entry.size)
                 speed = dlc_size / dlc_dur if dlc_dur > 0 else 0
-                total_retries += r.retry_count
                 self.app.telemetry.track_event(
                     "dlc_download_complete",
                     {
@@ -1164,7 +1566,6 @@ class DownloaderFrame(ctk.CTkFrame):
                     },
                 )
             elif r.state == DLCDownloadState.FAILED:
-                total_retries += r.retry_count
                 self.app.telemetry.track_event(
                     "dlc_download_failed",
                     {
@@ -1177,27 +1578,26 @@ class DownloaderFrame(ctk.CTkFrame):
 
         # Batch summary event
         avg_speed = total_bytes / duration if duration > 0 else 0
-        dlc_ids = [r.entry.dlc_id for r in results if r.state != DLCDownloadState.CANCELLED]
         self.app.telemetry.track_event(
             "dlc_batch_complete",
             {
-                "completed": completed + extracted,
-                "failed": failed,
-                "cancelled": cancelled,
+                "completed": stats.completed + stats.extracted,
+                "failed": stats.failed,
+                "cancelled": stats.cancelled,
                 "total_bytes": total_bytes,
                 "duration_seconds": round(duration, 1),
                 "avg_speed_bps": round(avg_speed),
-                "total_retries": total_retries,
-                "dlc_ids": dlc_ids,
+                "total_retries": stats.total_retries,
+                "dlc_ids": stats.dlc_ids,
             },
         )
 
-        if failed == 0 and cancelled == 0:
+        if stats.failed == 0 and stats.cancelled == 0:
             self.app.show_toast(
-                f"Downloaded {completed} DLC(s) successfully",
+                f"Downloaded {stats.completed} DLC(s) successfully",
                 "success",
             )
-        elif cancelled > 0:
+        elif stats.cancelled > 0:
             self.app.show_toast(f"Download cancelled. {summary}", "warning")
         else:
             self.app.show_toast(summary, "warning")
@@ -1206,16 +1606,16 @@ class DownloaderFrame(ctk.CTkFrame):
         self._update_summary_label()
 
     def _on_downloads_error(self, error):
-        self._busy = False
-        self._pause_btn.grid_remove()
-        self._resume_btn.grid_remove()
-        self._cancel_btn.grid_remove()
-        self._set_buttons_state("normal")
-        self._active_downloader = None
-        self.app.updater.reset_cancel()
-        self._log(f"[{_timestamp()}] Error: {error}")
+        self._finish_downloads()
+        self._log(f"Error: {error}")
         self.app.show_toast(f"Download error: {error}", "error")
 
+    def _on_downloads_blocked(self, error):
+        """Ban/access errors get the app-level dialog instead of a toast."""
+        self._finish_downloads()
+        self._log(f"Error: {error}")
+        self.app._show_error(error)
+
     # ── Pause / Resume / Cancel ──────────────────────────────────
 
     def _on_pause(self):
@@ -1226,7 +1626,7 @@ class DownloaderFrame(ctk.CTkFrame):
         self._pause_btn.grid_remove()
         self._resume_btn.grid()
         self._pause_start_time = time.monotonic()
-        self._log(f"[{_timestamp()}] Downloads paused")
+        self._log("Downloads paused")
         elapsed = time.monotonic() - self._download_start_time
         self.app.telemetry.track_event(
             "dlc_download_paused",
@@ -1244,7 +1644,7 @@ class DownloaderFrame(ctk.CTkFrame):
         if hasattr(self, "_pause_start_time") and self._pause_start_time:
             pause_dur = time.monotonic() - self._pause_start_time
             self._pause_start_time = 0.0
-        self._log(f"[{_timestamp()}] Downloads resumed")
+        self._log("Downloads resumed")
         self.app.telemetry.track_event(
             "dlc_download_resumed",
             {"pause_duration_seconds": round(pause_dur, 1)},
@@ -1260,7 +1660,7 @@ class DownloaderFrame(ctk.CTkFrame):
         self._cancel_btn.configure(state="disabled", text="Cancelling...")
         self._pause_btn.grid_remove()
         self._resume_btn.grid_remove()
-        self._log(f"[{_timestamp()}] Cancellation requested...")
+        self._log("Cancellation requested...")
         elapsed = time.monotonic() - self._download_start_time
         completed_so_far = self._completed_count + self._extracted_count
         self.app.telemetry.track_event(
@@ -1285,17 +1685,48 @@ class DownloaderFrame(ctk.CTkFrame):
     # ── Logging ───────────────────────────────────────────────────
 
     def _log(self, message: str):
-        """Append a line to the activity log (must be called on GUI thread)."""
+        """Queue a timestamped line for the activity log (must be called on GUI thread)."""
+        line = f"[{_timestamp()}] {message}"
+        with self._log_lock:
+            self._log_buffer.append(line)
+            if self._log_flush_pending:
+                return
+            self._log_flush_pending = True
+        self.after(_LOG_FLUSH_MS, self._flush_log)
+
+    def _enqueue_log(self, msg: str):
+        """Thread-safe timestamped log append."""
+        line = f"[{_timestamp()}] {msg}"
+        with self._log_lock:
+            self._log_buffer.append(line)
+            if self._log_flush_pending:
+                return
+            self._log_flush_pending = True
+        self.app._enqueue_gui(self._flush_log)
+
+    def _flush_log(self):
+        """GUI thread: write all buffered lines with one insert."""
+        with self._log_lock:
+            lines = self._log_buffer
+            self._log_buffer = deque(maxlen=_LOG_MAX_LINES)
+            self._log_flush_pending = False
+        if not lines:
+            return
         self._log_box.configure(state="normal")
-        self._log_box.insert("end", message + "\n")
+        self._log_box.insert("end", "\n".join(lines) + "\n")
+        # Entries can span lines (e.g. multi-line exception text)
+        self._log_line_count += sum(line.count("\n") + 1 for line in lines)
+        excess = self._log_line_count - _LOG_MAX_LINES
+        if excess > 0:
+            self._log_box.delete("1.0", f"{excess + 1}.0")
+            self._log_line_count = _LOG_MAX_LINES
         self._log_box.see("end")
         self._log_box.configure(state="disabled")
 
-    def _enqueue_log(self, msg: str):
-        """Thread-safe log append."""
-        self.app._enqueue_gui(self._log, msg)
-
     def _clear_log(self):
+        with self._log_lock:
+            self._log_buffer.clear()
         self._log_box.configure(state="normal")
         self._log_box.delete("1.0", "end")
+        self._log_line_count = 0
         self._log_box.configure(state="disabled")
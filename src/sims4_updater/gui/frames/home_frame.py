@@ -659,8 +659,16 @@ class HomeFrame(ctk.CTkFrame):
         if not self._entrance_played:
             self._entrance_played = True
             self._animate_entrance()
-        # Update pricing card if prices are available
-        if self.app.price_cache.is_valid:
+        # Update pricing card if prices are available (in memory or on disk)
+        cache = self.app.price_cache
+        if cache.is_valid:
+            self.update_pricing_card()
+        else:
+            # load() reads the snapshot once; later calls return without disk I/O
+            self.app.run_async(cache.load, on_done=self._on_price_cache_loaded)
+
+    def _on_price_cache_loaded(self, loaded: bool):
+        if loaded:
             self.update_pricing_card()
 
     def check_app_update(self):
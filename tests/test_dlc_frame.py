@@ -0,0 +1,45 @@
+"""Tests for DLCFrame's Apply selection logic."""
+
+from __future__ import annotations
+
+import pytest
+
+from sims4_updater.dlc.catalog import DLCInfo, DLCStatus
+
+pytest.importorskip("customtkinter")
+
+from sims4_updater.gui.frames.dlc_frame import DLCFrame  # noqa: E402
+
+
+def _status(dlc_id: str, **kwargs) -> DLCStatus:
+    dlc = DLCInfo(id=dlc_id, code="", code2="", pack_type="expansion", names={})
+    return DLCStatus(dlc=dlc, **kwargs)
+
+
+class TestApplySets:
+    def test_untouched_matching_config_is_noop(self):
+        states = [
+            _status("EP01", installed=True, registered=True, enabled=True),
+            _status("EP02", installed=True, registered=True, enabled=False),
+        ]
+        enabled, config = DLCFrame._apply_sets(states, {})
+        assert enabled == config == {"EP01"}
+
+    def test_owned_but_disabled_is_not_noop(self):
+        # Owned DLCs show checked, so Apply must re-enable them in the config
+        states = [_status("EP01", installed=True, owned=True, registered=True, enabled=False)]
+        enabled, config = DLCFrame._apply_sets(states, {})
+        assert enabled == {"EP01"}
+        assert config == set()
+
+    def test_enabled_but_not_installed_is_not_noop(self):
+        states = [_status("EP01", installed=False, registered=True, enabled=True)]
+        enabled, config = DLCFrame._apply_sets(states, {})
+        assert enabled == set()
+        assert config == {"EP01"}
+
+    def test_checkbox_value_overrides_loaded_state(self):
+        states = [_status("EP01", installed=True, registered=True, enabled=True)]
+        enabled, config = DLCFrame._apply_sets(states, {"EP01": False})
+        assert enabled == set()
+        assert config == {"EP01"}
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import threading
 import time
 
 from sims4_updater.core.rate_limiter import TokenBucketRateLimiter
@@ -57,3 +58,19 @@ class TestTokenBucketRateLimiter:
         limiter.acquire(100)  # well within the accumulated tokens
         elapsed = time.monotonic() - start
         assert elapsed < 0.05  # should succeed without blocking
+
+    def test_cancel_event_unblocks_acquire(self):
+        cancel = threading.Event()
+        limiter = TokenBucketRateLimiter(100, cancel_event=cancel)
+        threading.Timer(0.1, cancel.set).start()
+        start = time.monotonic()
+        limiter.acquire(10_000)  # would block ~100s without cancellation
+        assert time.monotonic() - start < 1.0
+
+    def test_already_cancelled_returns_immediately(self):
+        cancel = threading.Event()
+        cancel.set()
+        limiter = TokenBucketRateLimiter(100, cancel_event=cancel)
+        start = time.monotonic()
+        limiter.acquire(10_000)
+        assert time.monotonic() - start < 0.05
@@ -0,0 +1,156 @@
+"""Tests for the Steam price service."""
+
+from __future__ import annotations
+
+import threading
+from unittest.mock import MagicMock, patch
+
+from sims4_updater.dlc import steam
+
+
+def _response(status: int, payload: dict | None = None) -> MagicMock:
+    resp = MagicMock()
+    resp.status_code = status
+    resp.json.return_value = payload or {}
+    if status >= 400:
+        resp.raise_for_status.side_effect = Exception(f"HTTP {status}")
+    return resp
+
+
+_OK_PAYLOAD = {
+    "1234": {
+        "success": True,
+        "data": {
+            "price_overview": {
+                "currency": "USD",
+                "initial": 3999,
+                "final": 1999,
+                "discount_percent": 50,
+                "initial_formatted": "$39.99",
+                "final_formatted": "$19.99",
+            }
+        },
+    }
+}
+
+
+class TestFetchSinglePrice:
+    def test_parses_price_overview(self):
+        session = MagicMock()
+        session.get.return_value = _response(200, _OK_PAYLOAD)
+        with patch.object(steam, "_get_session", return_value=session):
+            price = steam._fetch_single_price(1234)
+        assert price is not None
+        assert price.final_cents == 1999
+        assert price.on_sale
+
+    def test_retries_on_throttle_then_succeeds(self):
+        session = MagicMock()
+        session.get.side_effect = [_response(429), _response(500), _response(200, _OK_PAYLOAD)]
+        with (
+            patch.object(steam, "_get_session", return_value=session),
+            patch.object(steam.time, "sleep") as sleep,
+        ):
+            price = steam._fetch_single_price(1234)
+        assert price is not None
+        assert session.get.call_count == 3
+        assert [c.args[0] for c in sleep.call_args_list] == [1, 2]
+
+    def test_gives_up_after_backoff_exhausted(self):
+        session = MagicMock()
+        session.get.return_value = _response(429)
+        with (
+            patch.object(steam, "_get_session", return_value=session),
+            patch.object(steam.time, "sleep"),
+        ):
+            price = steam._fetch_single_price(1234)
+        assert price is None
+        assert session.get.call_count == len(steam.RETRY_BACKOFF) + 1
+
+    def test_client_error_not_retried(self):
+        session = MagicMock()
+        session.get.return_value = _response(404)
+        with (
+            patch.object(steam, "_get_session", return_value=session),
+            patch.object(steam.time, "sleep") as sleep,
+        ):
+            assert steam._fetch_single_price(1234) is None
+        assert session.get.call_count == 1
+        sleep.assert_not_called()
+
+
+class TestGetSession:
+    def test_session_is_reused_within_a_thread(self):
+        assert steam._get_session() is steam._get_session()
+
+    def test_threads_get_their_own_session(self):
+        other = []
+        t = threading.Thread(target=lambda: other.append(steam._get_session()))
+        t.start()
+        t.join()
+        assert other[0] is not steam._get_session()
+
+    def test_batch_never_shares_a_session_across_threads(self):
+        users: dict[int, set[int]] = {}
+        lock = threading.Lock()
+
+        def make_session():
+            session = MagicMock()
+
+            def get(url, params, timeout):
+                with lock:
+                    users.setdefault(id(session), set()).add(threading.get_ident())
+                return _response(200, {params["appids"]: {"success": True, "data": {}}})
+
+            session.get.side_effect = get
+            return session
+
+        with patch.object(steam.requests, "Session", side_effect=make_session):
+            prices = steam.fetch_prices_batch(list(range(1, 25)))
+        assert len(prices) == 24
+        assert all(len(threads) == 1 for threads in users.values())
+
+
+class TestSteamPriceCacheDisk:
+    def test_save_then_load_round_trips(self, tmp_path):
+        path = tmp_path / "steam_prices.json"
+        cache = steam.SteamPriceCache(path=path)
+        cache.update({1234: steam.SteamPrice(app_id=1234, discount_percent=50)})
+        cache.save()
+
+        fresh = steam.SteamPriceCache(path=path)
+        assert fresh.load() is True
+        assert fresh.is_valid
+        price = fresh.get(1234)
+        assert price is not None
+        assert price.on_sale
+
+    def test_expired_snapshot_is_ignored(self, tmp_path):
+        path = tmp_path / "steam_prices.json"
+        cache = steam.SteamPriceCache(path=path)
+        cache.update({1234: steam.SteamPrice(app_id=1234)})
+        with patch("time.time", return_value=0):
+            cache.save()
+
+        fresh = steam.SteamPriceCache(path=path)
+        assert fresh.load() is False
+        assert not fresh.is_valid
+
+    def test_failed_load_does_not_reread_disk(self, tmp_path):
+        path = tmp_path / "steam_prices.json"
+        cache = steam.SteamPriceCache(path=path)
+        assert cache.load() is False
+        with patch("builtins.open") as mock_open:
+            assert cache.load() is False
+        mock_open.assert_not_called()
+
+    def test_corrupt_snapshot_is_ignored(self, tmp_path):
+        path = tmp_path / "steam_prices.json"
+        path.write_text("{not json", encoding="utf-8")
+        assert steam.SteamPriceCache(path=path).load() is False
+
+    def test_no_path_is_memory_only(self):
+        cache = steam.SteamPriceCache()
+        cache.update({1234: steam.SteamPrice(app_id=1234)})
+        cache.save()
+        assert cache.load() is False